@@ -2,10 +2,35 @@ import argparse
 import os, tomllib, tomli_w
 import sys
 
+try:
+    # Rust-backed TOML parser/serializer; noticeably faster than tomllib + tomli_w.
+    import rtoml
+except ImportError:
+    rtoml = None
+
 parser = argparse.ArgumentParser()
 parser.add_argument("--version", required=False)
 args = parser.parse_args()
 
+def load_toml(path: str) -> dict:
+    """Read a TOML file, preferring rtoml when it is installed."""
+    if rtoml is not None:
+        with open(path, "r", encoding="utf-8") as f:
+            return rtoml.load(f)
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+def dump_toml(config: dict, path: str):
+    """Write a TOML file, preferring rtoml when it is installed."""
+    if rtoml is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            rtoml.dump(config, f, pretty=True)
+        return
+
+    with open(path, "wb") as f:
+        tomli_w.dump(config, f)
+
 def expand_env_vars_in_toml(config: dict) -> dict:
 
     """Recursively replace ${VAR} in strings with environment values."""
@@ -22,34 +47,26 @@ def expand_env_vars_in_toml(config: dict) -> dict:
     return expand(config)
 
 try:
-    with open("pyproject.toml", "rb") as f:
-        config = tomllib.load(f)
+    config = load_toml("pyproject.toml")
 
     current_version = config['project']['version']
     major, minor, patch = map(int, current_version.split('.'))
 
-    if patch >= 99:
-        patch = 0
-        minor += 1
-
-        if minor >= 99:
-            minor = 0
-            major += 1
-    else:
-        patch += 1
+    # Bump as one mixed-radix number: patch rolls over after 99 and minor after 98
+    major_minor, patch = divmod((major * 99 + minor) * 100 + patch + 1, 100)
+    major, minor = divmod(major_minor, 99)
 
     version = args.version or f"{major}.{minor}.{patch}"
     config['project']['version'] = version or current_version
 
     expanded_config = expand_env_vars_in_toml(config)
 
+    # Verify in memory before writing; re-reading the file is unnecessary.
+    if expanded_config['project']['version'] != version:
+        raise ValueError(f"Version mismatch after expansion: {expanded_config['project']['version']} != {version}")
+
     # ---- Write back ----
-    with open("pyproject.toml", "wb") as f:
-        tomli_w.dump(expanded_config, f)
-    
-    #Verify:
-    with open("pyproject.toml", "rb") as f:
-        config_copied = tomllib.load(f)
+    dump_toml(expanded_config, "pyproject.toml")
     
     print(version)
 
@@ -1,6 +1,6 @@
 from utils.initialize_logger import initialize_logger
-from dotenv import load_dotenv
-load_dotenv()
+from utils.env import load_env_once
+load_env_once()
 initialize_logger()
 
 import logging
@@ -0,0 +1,109 @@
+import logging
+from typing import List
+from datetime import datetime
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, LargeBinary, String, delete, func, insert, select
+from langchain_core.messages import AnyMessage
+from utils.deserialization import deserialize_messages, serialize_messages, pack_payload, unpack_payload
+from initialize_app.create_app import SQLALCHEMY_DB
+
+
+class ChatMessageRepository(SQLALCHEMY_DB.Model):
+    """
+    SQLAlchemy ORM for the append-only per-message chat log.
+    Each row stores a single serialized LangChain message of a conversation, ordered by turn_index,
+    so a chat turn only writes its new messages instead of re-serializing the whole history.
+    """
+
+    __tablename__ = "chat_messages"
+    __table_args__ = (
+        Index('ix_chat_messages_conv_turn', 'conversation_id', 'turn_index'),
+        {'extend_existing': True}
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    conversation_id = Column(String, nullable=False)  # Matches ChatStateRepository.conversation_id
+    turn_index = Column(Integer, nullable=False)  # Position of the message in the conversation
+    role = Column(String(20), nullable=False)  # LangChain message type: human, ai, system, tool
+    content_blob = Column(LargeBinary, nullable=True)  # Serialized message packed with msgpack + zstd
+    content_json = Column(JSON, nullable=True)  # Legacy: message serialized to JSON text
+    timestamp = Column(DateTime, default=datetime.now, nullable=False)
+
+    def __init__(self, **kwargs):
+        self.conversation_id = kwargs.get("conversation_id")
+        self.turn_index = kwargs.get("turn_index", 0)
+        self.role = kwargs.get("role", "")
+        self.content_blob = kwargs.get("content_blob")
+        self.content_json = kwargs.get("content_json")
+        self.timestamp = kwargs.get("timestamp", datetime.now())
+
+    @classmethod
+    def count_messages(cls, conversation_id: str) -> int:
+        """Number of messages already persisted for a conversation."""
+        stmt = select(func.max(cls.turn_index)).where(cls.conversation_id == conversation_id)
+        last_index = SQLALCHEMY_DB.session.scalar(stmt)
+        return 0 if last_index is None else last_index + 1
+
+    @classmethod
+    def load_messages(cls, conversation_id: str) -> List[AnyMessage]:
+        """Load all messages of a conversation in turn order with a single query."""
+        stmt = (
+            select(cls.content_blob, cls.content_json)
+            .where(cls.conversation_id == conversation_id)
+            .order_by(cls.turn_index)
+        )
+        return cls._decode_rows(SQLALCHEMY_DB.session.execute(stmt))
+
+    @classmethod
+    def load_recent_messages(cls, conversation_id: str, n: int) -> List[AnyMessage]:
+        """
+        Load only the last n messages of a conversation, oldest first.
+        Reads the tail of the log through the (conversation_id, turn_index) index instead of
+        deserializing the whole history.
+        """
+        stmt = (
+            select(cls.content_blob, cls.content_json)
+            .where(cls.conversation_id == conversation_id)
+            .order_by(cls.turn_index.desc())
+            .limit(n)
+        )
+        return cls._decode_rows(reversed(SQLALCHEMY_DB.session.execute(stmt).all()))
+
+    @staticmethod
+    def _decode_rows(rows) -> List[AnyMessage]:
+        """Deserialize (content_blob, content_json) rows, falling back to the legacy JSON column."""
+        return deserialize_messages([
+            unpack_payload(blob) if blob is not None else legacy_json
+            for blob, legacy_json in rows
+        ])
+
+    @classmethod
+    def append_messages(cls, conversation_id: str, messages: List[AnyMessage], start_index: int = 0):
+        """
+        Stage new messages for a conversation, numbering them from start_index.
+        Rows are written with a single executemany INSERT rather than through ORM objects,
+        since the log is write-only on this path.
+        The caller is responsible for committing the session.
+        """
+        if not messages:
+            return
+
+        now = datetime.now()
+        SQLALCHEMY_DB.session.execute(insert(cls), [
+            {
+                "conversation_id": conversation_id,
+                "turn_index": start_index + offset,
+                "role": serialized.get("type", ""),
+                "content_blob": pack_payload(serialized),
+                "timestamp": now
+            }
+            for offset, serialized in enumerate(serialize_messages(messages))
+        ])
+        logging.debug(f"Appended {len(messages)} message(s) to conversation {conversation_id}")
+
+    @classmethod
+    def delete_messages(cls, conversation_id: str):
+        """
+        Stage deletion of all messages of a conversation (e.g. when history is cleared).
+        The caller is responsible for committing the session.
+        """
+        SQLALCHEMY_DB.session.execute(delete(cls).where(cls.conversation_id == conversation_id))
@@ -1,15 +1,24 @@
 import logging
 from typing import List, Dict, Any
 from api.chat_state import ChatState
+from api.chat_message_repository import ChatMessageRepository
 from utils.deserialization import deserialize_messages, serialize_messages
 from initialize_app.create_app import SQLALCHEMY_DB
-from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, select
+from sqlalchemy.orm import raiseload
 from langchain_core.messages import BaseMessage 
 
 import uuid
 from datetime import datetime
+from functools import cached_property
 from os import getlogin
 
+try:
+    # getlogin() is a syscall and can fail without a controlling terminal (daemons, services)
+    _DEFAULT_USER_ID = str(getlogin())
+except OSError:
+    _DEFAULT_USER_ID = "unknown"
+
 
 class ChatStateRepository(SQLALCHEMY_DB.Model):
     """
@@ -18,18 +27,25 @@ class ChatStateRepository(SQLALCHEMY_DB.Model):
     """
 
     __tablename__ = "chat_states"
-    __table_args__ = {'extend_existing': True}
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     conversation_id = Column(String, index=True, nullable=False, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(50), default=lambda: str(getlogin()))
+    user_id = Column(String(50), default=lambda: _DEFAULT_USER_ID)
     messages = Column(JSON, nullable=False)  # LangChain messages serialized to JSON
     timestamp = Column(DateTime, default=datetime.now, nullable=False)  # Renamed from created_at
     source = Column(String(2000), nullable=True)
 
+    # Latest-snapshot lookups filter on conversation_id/source and sort by timestamp DESC;
+    # these indexes satisfy both the filter and the ORDER BY without a sort step.
+    __table_args__ = (
+        Index('ix_chat_states_conv_ts_desc', 'conversation_id', timestamp.desc()),
+        Index('ix_chat_states_source_ts_desc', 'source', timestamp.desc()),
+        {'extend_existing': True}
+    )
+
     def __init__(self, **kwargs):
         self.conversation_id = kwargs.get("conversation_id", str(uuid.uuid4()))
-        self.user_id = kwargs.get("user_id", str(getlogin()))
+        self.user_id = kwargs.get("user_id", _DEFAULT_USER_ID)
         self.messages = kwargs.get("messages", [])
         self.timestamp = kwargs.get("timestamp", datetime.now())
         self.source = kwargs.get("source", '')
@@ -41,24 +57,51 @@ class ChatStateRepository(SQLALCHEMY_DB.Model):
         Output: {'messages': List[BaseMessage], 'conversation_id': str, 'user_id': str, 'timestamp': str}
         """
         return {
-            "messages": deserialize_messages(self.messages),
+            "messages": self._load_messages(),
             "conversation_id": self.conversation_id,
             "user_id": self.user_id,
             "timestamp": self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else str(self.timestamp)
         }
 
+    def _load_messages(self) -> List[BaseMessage]:
+        """Return a copy of the conversation messages, so callers can append to it freely."""
+        return list(self._deserialized)
+
+    @cached_property
+    def _deserialized(self) -> List[BaseMessage]:
+        """
+        Load and deserialize the conversation messages once per ORM instance.
+        Reads the per-message log; conversations saved before the log existed only carry
+        the JSON snapshot in this row.
+        """
+        messages = ChatMessageRepository.load_messages(self.conversation_id)
+        self._persisted_count = len(messages)
+        return messages if messages else deserialize_messages(self.messages)
+
     @classmethod
     def initialize_chat_session(cls, user_id: str | None = None) -> ChatState:
         """Create a new chat session with initial empty state."""
         record = cls(
-            user_id=user_id or str(getlogin()),
+            user_id=user_id or _DEFAULT_USER_ID,
             messages=[]
         )
         SQLALCHEMY_DB.session.add(record)
         SQLALCHEMY_DB.session.commit()
-        SQLALCHEMY_DB.session.refresh(record)
         return record
     
+    @classmethod
+    def get_recent_messages(cls, conversation_id: str, n: int = 50) -> List[BaseMessage]:
+        """
+        Get the last n messages of a conversation without loading the full history.
+        Conversations saved before the per-message log existed are sliced from their JSON snapshot.
+        """
+        messages = ChatMessageRepository.load_recent_messages(conversation_id, n)
+        if messages:
+            return messages
+
+        record = cls.load_latest_record(conversation_id=conversation_id)
+        return deserialize_messages(record.messages)[-n:] if record else []
+
     @classmethod
     def get_conversation_history(cls, conversation_id: str, limit: int | None = None):
         """Get all state snapshots for a conversation, ordered chronologically."""
@@ -79,26 +122,75 @@ class ChatStateRepository(SQLALCHEMY_DB.Model):
         """
         return cls(
             conversation_id=state.get("conversation_id", str(uuid.uuid4())),
-            user_id=state.get("user_id", str(getlogin())),
+            user_id=state.get("user_id", _DEFAULT_USER_ID),
             messages=serialize_messages(state.get("messages", [])),
             timestamp=state.get("timestamp", datetime.now())
         )
 
     def save_state_snapshot(self, state: Dict[str, Any]):
         """
-        Save a new snapshot of the ChatState.
-        Creates a new row for history tracking - does NOT update existing row.
+        Persist the messages added to the ChatState since the last save.
+        Only the new messages are appended to the per-message log and this session row is
+        updated in place, so each turn writes O(new messages) rather than the whole history.
         """
-        new_record = ChatStateRepository(
-            conversation_id=state.get("conversation_id", self.conversation_id),
-            user_id=state.get("user_id", self.user_id),
-            messages=serialize_messages(state.get("messages", [])),
-            timestamp=state.get("timestamp", datetime.now())
+        messages = state.get("messages", [])
+
+        # Rows loaded through to_chat_state (or saved before) already know how far the log goes
+        persisted_count = getattr(self, "_persisted_count", None)
+        if persisted_count is None:
+            persisted_count = ChatMessageRepository.count_messages(self.conversation_id)
+
+        if len(messages) < persisted_count:
+            # History was cleared or rewritten; replace the stored log
+            ChatMessageRepository.delete_messages(self.conversation_id)
+            persisted_count = 0
+
+        ChatMessageRepository.append_messages(
+            self.conversation_id,
+            messages[persisted_count:],
+            start_index=persisted_count
         )
-        SQLALCHEMY_DB.session.add(new_record)
+
+        # Messages now live in the log; keep the session row lightweight
+        self.messages = []
+        self.timestamp = datetime.now()
+        SQLALCHEMY_DB.session.add(self)
         SQLALCHEMY_DB.session.commit()
-        SQLALCHEMY_DB.session.refresh(new_record)
-        return new_record
+        self._persisted_count = len(messages)
+        # The log now holds exactly these messages; prime the cache instead of re-reading it
+        self.__dict__['_deserialized'] = list(messages)
+        return self
+
+    @classmethod
+    def load_latest_record(cls, conversation_id: str | None = None,
+                           source: str | None = None) -> 'ChatStateRepository | None':
+        """
+        Fetch the most recent snapshot row for a conversation (or source) in a single query.
+        Lazy loads are disabled so any accidental relationship access raises instead of
+        silently issuing another round-trip.
+        """
+        if conversation_id:
+            criterion = cls.conversation_id == conversation_id
+        elif source:
+            criterion = cls.source == source
+        else:
+            return None
+
+        stmt = (
+            select(cls)
+            .options(raiseload('*'))
+            .where(criterion)
+            .order_by(cls.timestamp.desc())
+            .limit(1)
+            .execution_options(populate_existing=True)
+        )
+        record = SQLALCHEMY_DB.session.scalars(stmt).first()
+        if record:
+            # populate_existing refreshed the columns; drop what an earlier load cached about the log,
+            # since another writer may have appended to it since
+            record.__dict__.pop('_deserialized', None)
+            record.__dict__.pop('_persisted_count', None)
+        return record
 
     @classmethod
     def load_chat_state(cls, conversation_id: str | None = None, 
@@ -108,22 +200,9 @@ class ChatStateRepository(SQLALCHEMY_DB.Model):
         Returns ChatState dict or None if not found.
         """
         try:
-            
-            if conversation_id:
-                record: ChatStateRepository  = cls.query.filter(
-                    cls.conversation_id == conversation_id
-                ).order_by(cls.timestamp.desc()).first()
-
-            elif source:
-                record: ChatStateRepository  = cls.query.filter(
-                    cls.source == source
-                ).order_by(cls.timestamp.desc()).first()
-            else:
-                return None
-
+            record = cls.load_latest_record(conversation_id=conversation_id, source=source)
             if record:
-                SQLALCHEMY_DB.session.refresh(record)
-                return record.to_chat_state() if record else None
+                return record.to_chat_state()
         
         except Exception as e:
             logging.error(f"Error loading chat state for conversation {conversation_id} or source {source}: {e}")
@@ -134,10 +213,8 @@ class ChatStateRepository(SQLALCHEMY_DB.Model):
     def save_chat_state(cls, state: Dict[str, Any]) -> 'ChatStateRepository':
         """
         Save a new ChatState to database.
-        Creates new record from state dict.
+        Creates a new session record and stores its messages in the per-message log.
         """
-        record = cls.from_chat_state(state)
+        record = cls.from_chat_state({**state, "messages": []})
         SQLALCHEMY_DB.session.add(record)
-        SQLALCHEMY_DB.session.commit()
-        SQLALCHEMY_DB.session.refresh(record)
-        return record
+        return record.save_state_snapshot(state)
@@ -0,0 +1,97 @@
+import logging
+from typing import List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.messages import AnyMessage
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_huggingface import HuggingFaceEmbeddings
+
+
+def _message_text(message: AnyMessage) -> str:
+    """Plain text of a message; structured content is flattened to its string form."""
+    return message.content if isinstance(message.content, str) else str(message.content)
+
+
+class ConversationMemory:
+    """
+    Semantic recall over the older turns of a conversation.
+    Rather than sending the whole history to the LLM on every turn, only the most recent turns
+    plus the older messages most similar to the current query are passed as context, which caps
+    the input tokens regardless of conversation length.
+    Older messages are embedded incrementally with the same local HuggingFace model used by the
+    RAG Retriever and kept in an in-memory vector store.
+    """
+
+    def __init__(
+        self,
+        recent_turns: int = 4,
+        top_k: int = 10,
+        embedding: Optional[HuggingFaceEmbeddings] = None
+    ):
+        self.recent_turns = recent_turns
+        self.top_k = top_k
+        self._embedding = embedding
+        self._vectorstore: Optional[InMemoryVectorStore] = None
+        self._indexed_count = 0
+
+    def _get_vectorstore(self) -> InMemoryVectorStore:
+        """Create the vector store on first use so short conversations never load the embedding model."""
+        if self._vectorstore is None:
+            if self._embedding is None:
+                self._embedding = HuggingFaceEmbeddings(
+                    model_name="sentence-transformers/all-MiniLM-L6-v2",
+                    model_kwargs={'device': 'cpu'},
+                    encode_kwargs={'normalize_embeddings': True}
+                )
+            self._vectorstore = InMemoryVectorStore(embedding=self._embedding)
+        return self._vectorstore
+
+    def _index(self, messages: List[AnyMessage]):
+        """Embed the messages added since the last call."""
+        new_messages = messages[self._indexed_count:]
+        documents = [
+            Document(page_content=_message_text(msg), metadata={"turn_index": self._indexed_count + offset})
+            for offset, msg in enumerate(new_messages)
+            # AI tool calls are never recalled on their own: without their tool results the
+            # request is rejected, and the results are sent only inside the recent window
+            if msg.type in ("human", "ai") and not getattr(msg, "tool_calls", None)
+            and _message_text(msg).strip()
+        ]
+
+        if documents:
+            self._get_vectorstore().add_documents(documents)
+        self._indexed_count = len(messages)
+
+    def select_context(self, messages: List[AnyMessage]) -> List[AnyMessage]:
+        """
+        Pick the messages to send to the LLM for the current turn.
+        Returns the older messages relevant to the last (pending) message, in conversation order,
+        followed by the last recent_turns exchanges and the pending message itself. The recent
+        window is widened back to the start of a human turn, so AI tool calls and their tool
+        results are always sent together.
+        """
+        recent_count = self.recent_turns * 2 + 1
+        if len(messages) <= recent_count:
+            return messages
+
+        cutoff = len(messages) - recent_count
+        # Start the recent window on a human turn so a tool call is never split from its results
+        while cutoff > 0 and messages[cutoff].type != "human":
+            cutoff -= 1
+        if cutoff == 0:
+            return messages
+
+        try:
+            self._index(messages[:cutoff])
+            docs = self._get_vectorstore().similarity_search(_message_text(messages[-1]), k=self.top_k)
+            relevant = sorted({doc.metadata["turn_index"] for doc in docs})
+        except Exception as e:
+            logging.error(f"Error recalling relevant messages, sending recent turns only: {e}")
+            relevant = []
+
+        return [messages[i] for i in relevant] + messages[cutoff:]
+
+    def reset(self):
+        """Forget indexed messages (e.g. after the conversation history is cleared)."""
+        self._vectorstore = None
+        self._indexed_count = 0
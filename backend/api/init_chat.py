@@ -1,3 +1,4 @@
+from functools import lru_cache
 from os import getenv
 # import anthropic
 from api.chat_state import ChatState
@@ -12,9 +13,10 @@ api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 def create_initial_state(conversation_id: str) -> ChatState:
     """Create an initial chat state; or load from a database in production."""
-    ChatStateRepository.load_chat_state(conversation_id=conversation_id) if conversation_id \
-        else ChatStateRepository.initialize_chat_session()
+    state = ChatStateRepository.load_chat_state(conversation_id=conversation_id) if conversation_id else None
+    return state or ChatStateRepository.initialize_chat_session().to_chat_state()
 
+@lru_cache(maxsize=1)
 def init_workflow():
     """Initialize the RAG workflow singleton."""
     from tools.rag.workflow import RAG_WORKFLOW_INSTANCE
@@ -7,17 +7,14 @@ def init_state(conversation_id: str = ""):
     try:
         record = None
         if conversation_id != "":
-            # Load the latest ChatState snapshot for this conversation
-            state = ChatStateRepository.load_chat_state(conversation_id)
-            if state:
-                record = ChatStateRepository.query.filter(
-                    ChatStateRepository.conversation_id == conversation_id
-                ).order_by(ChatStateRepository.timestamp.desc()).first()
+            # Load the latest ChatState snapshot for this conversation (single query)
+            record = ChatStateRepository.load_latest_record(conversation_id=conversation_id)
 
         if not record:
             # Create new conversation
             record = ChatStateRepository.initialize_chat_session()
-            state = record.to_chat_state()
+
+        state = record.to_chat_state()
 
         return state, record
     
@@ -9,9 +9,8 @@ This module provides a terminal-based interactive chatbot that:
 
 import logging
 from typing import Optional, Literal
-from langchain_core.messages import HumanMessage, AIMessage
-from api.chat_state_repository import ChatStateRepository
-from api.init_state import init_state
+# LangChain, the ORM models and the embedding stack are imported where they are first needed,
+# so importing this module (e.g. for the CLI entry point) stays cheap.
 
 
 class InteractiveChat:
@@ -35,6 +34,7 @@ class InteractiveChat:
         self.agent = None
         self.rag_workflow = None
         self.article_generator = None
+        self.memory = None
         
         # Initialize state
         self._init_conversation(conversation_id)
@@ -49,6 +49,7 @@ class InteractiveChat:
     
     def _init_conversation(self, conversation_id: str):
         """Initialize or load conversation state."""
+        from api.init_state import init_state
         self.state, self.record = init_state(conversation_id)
         if not self.state:
             raise ValueError("Failed to initialize chat state")
@@ -58,7 +59,9 @@ class InteractiveChat:
     
     def _init_agent(self):
         """Initialize the default agent."""
+        from api.conversation_memory import ConversationMemory
         from models import llm_basic as AGENT_MANAGER
+        self.memory = ConversationMemory()
         self.agent = AGENT_MANAGER
         if not self.agent:
             raise ValueError("Agent not initialized. Check model configuration.")
@@ -69,7 +72,7 @@ class InteractiveChat:
         from tools.rag.workflow import RAG_WORKFLOW_INSTANCE
         
         # Check if already initialized, otherwise initialize with default sources
-        if not RAG_WORKFLOW_INSTANCE._documents:
+        if not RAG_WORKFLOW_INSTANCE.is_initialized:
             print("\n⚠️  RAG workflow not initialized. Please provide document sources:")
             print("Example: ['path/to/doc.pdf', 'https://example.com/article']")
             sources = input("Enter sources (comma-separated) or press Enter for default: ").strip()
@@ -127,6 +130,8 @@ class InteractiveChat:
         Returns:
             Assistant's response
         """
+        from langchain_core.messages import HumanMessage, AIMessage
+        
         # Add user message to state
         self.state["messages"].append(HumanMessage(content=user_input))
         
@@ -150,7 +155,8 @@ class InteractiveChat:
     
     def _chat_with_agent(self) -> str:
         """Chat using the default agent."""
-        result = self.agent.invoke({"messages": self.state["messages"]})
+        # Send the recent turns plus semantically relevant older messages, not the whole history
+        result = self.agent.invoke({"messages": self.memory.select_context(self.state["messages"])})
         
         if "messages" in result:
             return result["messages"][-1].content
@@ -167,13 +173,16 @@ class InteractiveChat:
         result = self.article_generator.invoke_chat(self.state["messages"])
         return result["messages"][-1].content
     
-    def show_history(self):
-        """Display conversation history."""
+    def show_history(self, n: int = 50):
+        """Display the last n messages of the conversation history."""
         print("\n" + "="*80)
         print("CONVERSATION HISTORY")
         print("="*80 + "\n")
         
-        for i, msg in enumerate(self.state["messages"], 1):
+        # The session already holds the whole history, including messages not saved yet
+        messages = self.state["messages"][-n:] if n > 0 else []
+        first_index = len(self.state["messages"]) - len(messages) + 1
+        for i, msg in enumerate(messages, first_index):
             role = "USER" if msg.type == "human" else "ASSISTANT"
             print(f"[{i}] {role}: {msg.content[:100]}...")
             print()
@@ -217,6 +226,8 @@ class InteractiveChat:
         if confirm == "yes":
             self.state["messages"] = []
             self.record.save_state_snapshot(self.state)
+            if self.memory:
+                self.memory.reset()
             print("✓ History cleared")
     
     def get_conversation_id(self) -> str:
@@ -1,6 +1,5 @@
 # import anthropic
-from flask import request, jsonify, Blueprint, Response
-from langchain_core.messages import HumanMessage
+from flask import request, jsonify, Blueprint, Response, stream_with_context
 
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
@@ -11,7 +10,10 @@ def chat_stream():
     Process chatbot request and stream response using Server-Sent Events.
     """
 
+    from langchain_core.messages import HumanMessage
     from api.init_state import init_state
+    from api.chat_state_repository import ChatStateRepository
+    from initialize_app.create_app import SQLALCHEMY_DB
     from models.chief_agent import AGENT_MANAGER as agent
     import logging
     
@@ -38,9 +40,15 @@ def chat_stream():
 
     state["messages"].append(HumanMessage(content=user_input))
 
+    # Release the DB connection before streaming; the LLM stream can take minutes and
+    # must not pin a pooled connection. The record is re-fetched by PK for the final save.
+    record_id = record.id
+    SQLALCHEMY_DB.session.expunge_all()
+    SQLALCHEMY_DB.session.close()
+
     def generate():
 
-        import json
+        import orjson
         from langchain_core.messages import AIMessage
         
         nonlocal state, record
@@ -70,16 +78,20 @@ def chat_stream():
                     content = chunk.content
                     reply_text += content
                     logging.info(f"Content: {content}")
-                    yield f"data: {json.dumps({'content': content})}\n\n"
+                    yield b"data: " + orjson.dumps({'content': content}) + b"\n\n"
             
-            # Save conversation state
+            # Save conversation state in a short-lived session
             state["messages"].append(AIMessage(content=reply_text))
-            record.save_state_snapshot(state)
+            try:
+                record = SQLALCHEMY_DB.session.get(ChatStateRepository, record_id)
+                record.save_state_snapshot(state)
+            finally:
+                SQLALCHEMY_DB.session.close()
             
             # Send final message with conversation ID
-            yield f"data: {json.dumps({'done': True, 'conversation_id': record.conversation_id})}\n\n"
+            yield b"data: " + orjson.dumps({'done': True, 'conversation_id': record.conversation_id}) + b"\n\n"
             
         except Exception as e:
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield b"data: " + orjson.dumps({'error': str(e)}) + b"\n\n"
     
-    return Response(generate(), mimetype='text/event-stream')
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
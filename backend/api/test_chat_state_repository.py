@@ -0,0 +1,100 @@
+"""
+Query-count checks for the chat state hot path: loading the latest snapshot and saving a turn
+should stay at a fixed number of round-trips regardless of how long the conversation is.
+"""
+
+import pytest
+from flask import Flask
+from sqlalchemy import select
+from langchain_core.messages import AIMessage, HumanMessage
+
+from api.chat_message_repository import ChatMessageRepository
+from api.chat_state_repository import ChatStateRepository
+from initialize_app.create_app import SQLALCHEMY_DB
+from utils.query_counter import count_queries
+
+
+@pytest.fixture
+def app_context():
+    """In-memory SQLite app sharing the repository models, so tests never touch the real database."""
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    SQLALCHEMY_DB.init_app(app)
+
+    with app.app_context():
+        SQLALCHEMY_DB.create_all()
+        yield
+        SQLALCHEMY_DB.session.remove()
+        SQLALCHEMY_DB.drop_all()
+
+
+def _saved_conversation(n_turns: int) -> str:
+    messages = []
+    for i in range(n_turns):
+        messages += [HumanMessage(content=f"question {i}"), AIMessage(content=f"answer {i}")]
+
+    record = ChatStateRepository.save_chat_state({"messages": messages})
+    SQLALCHEMY_DB.session.expunge_all()
+    return record.conversation_id
+
+
+@pytest.mark.parametrize("n_turns", [1, 25])
+def test_load_latest_record_is_one_query(app_context, n_turns):
+    conversation_id = _saved_conversation(n_turns)
+
+    with count_queries(SQLALCHEMY_DB.engine) as queries:
+        record = ChatStateRepository.load_latest_record(conversation_id=conversation_id)
+
+    assert record is not None
+    assert len(queries) == 1
+
+
+@pytest.mark.parametrize("n_turns", [1, 25])
+def test_load_chat_state_is_at_most_two_queries(app_context, n_turns):
+    conversation_id = _saved_conversation(n_turns)
+
+    with count_queries(SQLALCHEMY_DB.engine) as queries:
+        state = ChatStateRepository.load_chat_state(conversation_id=conversation_id)
+
+    assert len(state["messages"]) == 2 * n_turns
+    assert len(queries) <= 2
+
+
+@pytest.mark.parametrize("n_turns", [1, 25])
+def test_save_state_snapshot_after_load_is_at_most_two_queries(app_context, n_turns):
+    conversation_id = _saved_conversation(n_turns)
+    record = ChatStateRepository.load_latest_record(conversation_id=conversation_id)
+    state = record.to_chat_state()
+    state["messages"] += [HumanMessage(content="follow-up"), AIMessage(content="reply")]
+
+    with count_queries(SQLALCHEMY_DB.engine) as queries:
+        record.save_state_snapshot(state)
+
+    # One batched INSERT for the new messages and one UPDATE of the session row
+    assert len(queries) <= 2
+
+    SQLALCHEMY_DB.session.expunge_all()
+    reloaded = ChatStateRepository.load_chat_state(conversation_id=conversation_id)
+    assert len(reloaded["messages"]) == 2 * n_turns + 2
+
+
+def test_reload_does_not_trust_stale_persisted_count(app_context):
+    conversation_id = _saved_conversation(1)
+    record = ChatStateRepository.load_latest_record(conversation_id=conversation_id)
+    state = record.to_chat_state()
+
+    # Another writer appends a turn behind this session's back
+    ChatMessageRepository.append_messages(
+        conversation_id, [HumanMessage(content="other"), AIMessage(content="writer")], start_index=2
+    )
+    SQLALCHEMY_DB.session.commit()
+
+    # This session reloads the row and saves its own state without re-reading the messages
+    record = ChatStateRepository.load_latest_record(conversation_id=conversation_id)
+    state["messages"] += [HumanMessage(content="follow-up"), AIMessage(content="reply")]
+    record.save_state_snapshot(state)
+
+    turn_indexes = SQLALCHEMY_DB.session.scalars(
+        select(ChatMessageRepository.turn_index).where(ChatMessageRepository.conversation_id == conversation_id)
+    ).all()
+    assert sorted(turn_indexes) == list(range(len(turn_indexes)))
@@ -0,0 +1,58 @@
+"""
+ConversationMemory must never hand the LLM half of a tool-call exchange: an AI message with
+tool_calls without its ToolMessage results (or the reverse) is rejected by the Anthropic API.
+"""
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from api.conversation_memory import ConversationMemory
+
+
+def _memory(recent_turns: int) -> ConversationMemory:
+    # top_k larger than any history here, so recall returns every indexed message
+    return ConversationMemory(recent_turns=recent_turns, top_k=50, embedding=DeterministicFakeEmbedding(size=16))
+
+
+def _tool_turn(i: int, call_text: str = "") -> list:
+    call_id = f"call_{i}"
+    return [
+        HumanMessage(content=f"What is the status of shipment {i}?"),
+        AIMessage(content=call_text,
+                  tool_calls=[{"name": "lookup_shipment", "args": {"id": i}, "id": call_id}]),
+        ToolMessage(content=f"Shipment {i} is in transit.", tool_call_id=call_id),
+        AIMessage(content=f"Shipment {i} is in transit."),
+    ]
+
+
+def _plain_turn(i: int) -> list:
+    return [HumanMessage(content=f"question {i}"), AIMessage(content=f"answer {i}")]
+
+
+def _assert_tool_calls_paired(context: list):
+    call_ids = {call["id"] for msg in context if msg.type == "ai" for call in msg.tool_calls}
+    result_ids = {msg.tool_call_id for msg in context if msg.type == "tool"}
+    assert call_ids == result_ids
+
+
+def test_recent_window_does_not_split_a_tool_call_turn():
+    messages = _plain_turn(0) + _tool_turn(1) + _plain_turn(2) + [HumanMessage(content="pending")]
+    # recent_turns=2 puts the fixed cutoff on the ToolMessage of the tool-call turn
+    assert messages[len(messages) - 5].type == "tool"
+
+    context = _memory(recent_turns=2).select_context(messages)
+
+    _assert_tool_calls_paired(context)
+    assert context[-1].content == "pending"
+
+
+def test_recall_never_returns_half_of_a_tool_call_pair():
+    messages = (_tool_turn(0, call_text="Let me look that up.") + _plain_turn(1) + _plain_turn(2)
+                + _plain_turn(3) + [HumanMessage(content="pending")])
+
+    context = _memory(recent_turns=1).select_context(messages)
+
+    # The tool-call turn is outside the recent window, so neither half of it may be recalled
+    _assert_tool_calls_paired(context)
+    assert not any(msg.type == "tool" or getattr(msg, "tool_calls", None) for msg in context)
+    assert context[-3:] == messages[-3:]
@@ -13,10 +13,18 @@ def create_app():
     # Create database tables within app context
     with app.app_context():
         SQLALCHEMY_DB.create_all()
+
+        query_warn_threshold = app.config.get("SQL_QUERY_WARN_THRESHOLD", 0)
+        if query_warn_threshold:
+            from utils.query_counter import register_query_counter
+            register_query_counter(app, SQLALCHEMY_DB.engine, query_warn_threshold)
     
     return app
 
-app = create_app()
+# The document loader's spawned parser processes re-run the entry script as __mp_main__; they only
+# parse files, so only the real process builds the app (waitress imports this module as backend.app).
+if __name__ != "__mp_main__":
+    app = create_app()
 
 if __name__ == "__main__":
     app.run()
\ No newline at end of file
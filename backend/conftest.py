@@ -0,0 +1,8 @@
+import os
+import tempfile
+from pathlib import Path
+
+# Importing api/ creates the tables on the configured database, so point it at a throwaway
+# file before any test module is collected; the real backend/data/messages.db is never opened.
+_TEST_DB_DIR = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_TEST_DB_DIR.name) / 'test.db'}"
@@ -1,21 +1,98 @@
+import asyncio
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import get_context
 from pathlib import Path
-from typing import List, Union
+from typing import List, Tuple, Union
 
-from langchain_community.document_loaders import (
-    PyPDFLoader,
-    UnstructuredPowerPointLoader,
-    UnstructuredWordDocumentLoader
-)
 from langchain_core.documents import Document
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from doc_loader.load_video_audio import transcribe_audio
-from doc_loader.load_url import transcribe_url
+from doc_loader.doc_parser import ChunkingStrategy, canonical_source, is_cpu_bound, is_url, parse_source
 from doc_loader.document_repository import DocumentRepository
+from doc_loader.load_url import is_youtube_url
 from initialize_app.create_app import INITIALIZED_FLASK_APP as app
 from models.anthropic.token_counter import count_tokens_anthropic
 
 
+# Process-local LRU of already decoded documents, in front of the SQL document cache.
+# Keys are (canonical source, chunk_size, chunk_overlap, chunking_strategy, mtime_ns) so edited local files miss
+# automatically; the canonical source is also the SQL cache key, so both layers agree on what a source is.
+_DOCUMENT_MEMO_SIZE = 512
+_document_memo: "OrderedDict[Tuple[str, int, int, str, int], List[Document]]" = OrderedDict()
+_document_memo_lock = threading.Lock()
+
+
+def _memo_key(source_key: str, file_path: Union[str, Path], chunk_size: int, chunk_overlap: int,
+              chunking_strategy: ChunkingStrategy = "fixed") -> Tuple[str, int, int, str, int]:
+    try:
+        mtime_ns = 0 if is_url(file_path) else Path(file_path).stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return (source_key, chunk_size, chunk_overlap, chunking_strategy, mtime_ns)
+
+
+def _memo_get(key: Tuple[str, int, int, str, int]) -> List[Document] | None:
+    with _document_memo_lock:
+        documents = _document_memo.get(key)
+        if documents is not None:
+            _document_memo.move_to_end(key)
+        return documents
+
+
+def _memo_put(key: Tuple[str, int, int, str, int], documents: List[Document]):
+    with _document_memo_lock:
+        _document_memo[key] = documents
+        _document_memo.move_to_end(key)
+        if len(_document_memo) > _DOCUMENT_MEMO_SIZE:
+            _document_memo.popitem(last=False)
+
+
+def _number_of_workers() -> int:
+    """Worker count for document loading, from LOAD_DOCUMENTS_NUMBER_OF_THREADS or cores - 1."""
+    default_workers = max((os.cpu_count() or 2) - 1, 1)
+    try:
+        return max(int(os.getenv("LOAD_DOCUMENTS_NUMBER_OF_THREADS", default_workers)), 1)
+    except ValueError:
+        return default_workers
+
+
+# Fewer PDF/PPTX/DOCX sources than this per load are parsed on threads: below it, starting worker
+# processes costs more than the parallel parsing saves.
+_PROCESS_POOL_MIN_SOURCES = int(os.getenv("LOAD_DOCUMENTS_PROCESS_MIN_SOURCES", "8"))
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Parser process pool shared by all loads, created on first use.
+    Workers are spawned rather than forked: forking would copy the locks held by the loader threads
+    running in this process, and spawned workers only import doc_loader.doc_parser. They do re-run
+    the entry script as __mp_main__, so entry scripts keep their start-up behind a __main__ guard.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=_number_of_workers(),
+                mp_context=get_context("spawn")
+            )
+        return _process_pool
+
+
+def _discard_process_pool():
+    """Drop a broken process pool so the next large load starts a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
 class DocumentImporter:
 
     def __init__(
@@ -23,10 +100,12 @@ class DocumentImporter:
             data_sources: Union[List[Union[str, Path]], None] = None,
             chunk_size: int = 1000,
             chunk_overlap: int = 200,
-            use_cache: bool = True):
+            use_cache: bool = True,
+            chunking_strategy: ChunkingStrategy = "fixed"):
         
         self.__chunk_size = chunk_size
         self.__chunk_overlap = chunk_overlap
+        self.__chunking_strategy = chunking_strategy
         self.__use_cache = use_cache
         self.__data_sources = data_sources or [Path().resolve() / "docs"]
         self.__documents: List[Document] = []
@@ -34,79 +113,26 @@ class DocumentImporter:
     @property
     def documents(self) -> List[Document]:
         return self.__documents or []
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop the process-local memo of decoded documents (the SQL cache is left untouched)."""
+        with _document_memo_lock:
+            _document_memo.clear()
     
-    def __load_doc(self, file_path: Union[str, Path]) -> List[Document]:
-        """
-        This function detects the file format and loads into langchain document using an appropriate langchain module.
-        Uses caching to avoid reprocessing the same documents.
-        """
-        
-        source_path = str(file_path)
-        
-        # Check cache first if enabled
-        if self.__use_cache:
-            cached_docs = []
+    def __save_cached(self, cache_key: str, split_documents: List[Document]):
+        """Store split documents in the SQL cache."""
+        try:
             with app.app_context():
-                cached_docs = DocumentRepository.get_cached_documents(
-                    source_path, 
+                DocumentRepository.save_documents(
+                    cache_key, 
+                    split_documents, 
                     self.__chunk_size, 
-                    self.__chunk_overlap
+                    self.__chunk_overlap,
+                    self.__chunking_strategy
                 )
-
-            if cached_docs:
-                return cached_docs
-    
-        # Handle URLs separately
-        if isinstance(file_path, str) and str(file_path).lower().startswith("http"):
-            raw_documents = transcribe_url(file_path)
-            filename_lower = file_path.lower()
-        else:
-            # Handle file paths
-            file_path = Path(file_path).resolve()
-            raw_documents = []
-            filename_lower = file_path.name.lower()
-
-            if file_path.suffix.lower() == ".pdf":
-                try:
-                    loader = PyPDFLoader(str(file_path))
-                    raw_documents = loader.load()
-                except Exception as e:
-                    logging.info(f"Error loading {file_path}: {e}")
-
-            elif file_path.suffix.lower() == ".pptx":
-                try:
-                    loader = UnstructuredPowerPointLoader(str(file_path))
-                    raw_documents = loader.load()
-                except Exception as e:
-                    logging.info(f"Error loading {file_path}: {e}")
-
-            elif file_path.suffix.lower() == ".docx":
-                try:
-                    loader = UnstructuredWordDocumentLoader(str(file_path))
-                    raw_documents = loader.load()
-                except Exception as e:
-                    logging.info(f"Error loading {file_path}: {e}")
-
-            elif file_path.suffix.lower() in [".mp4", ".mp3", ".wav", ".m4a", ".avi", ".mov"]:
-                raw_documents = transcribe_audio(file_path)
-        
-        # Split the documents
-        split_documents = self.__chunk_documents(raw_documents)
-        
-        # Cache the split documents if caching is enabled
-        if self.__use_cache and split_documents:
-            try:
-                with app.app_context():
-                    DocumentRepository.save_documents(
-                        filename_lower, 
-                        split_documents, 
-                        self.__chunk_size, 
-                        self.__chunk_overlap
-                    )
-            except Exception as e:
-                logging.warning(f"Failed to cache documents for {source_path}: {e}")
-
-        return split_documents
+        except Exception as e:
+            logging.warning(f"Failed to cache documents for {cache_key}: {e}")
 
     def load_docs(self, 
                   document_paths: Union[List[Union[str, Path]], None] = None) -> List[Document]:
@@ -128,7 +154,9 @@ class DocumentImporter:
             src_path = Path(src_pth).resolve()
     
             if src_path.is_dir() and src_path.exists():
-                source_document_files.extend([p for p in src_path.iterdir() if p.is_file()])
+                # scandir entries carry the file type, so no extra stat() per entry (except symlinks)
+                with os.scandir(src_path) as entries:
+                    source_document_files.extend(Path(entry.path) for entry in entries if entry.is_file())
 
             elif src_path.is_file() and src_path.exists():
                 source_document_files.append(src_path)
@@ -137,37 +165,119 @@ class DocumentImporter:
                 # It is most likely a URL.
                 source_document_files.append(src_pth)
         
-        for file_path in set(source_document_files):
+        # Cache lookups and writes stay in this process so SQLAlchemy is only used from one thread;
+        # the workers only parse and split.
+        # Paths and URL strings hash differently, so de-duplicate on the canonical form, which is
+        # also the SQL cache key parse_source returns; the same source given twice is loaded once.
+        seen = set()
+        source_keys = {}
+        for file_path in source_document_files:
+            key = canonical_source(file_path)
+            if key not in seen:
+                seen.add(key)
+                source_keys[file_path] = key
+
+        memo_keys = {
+            file_path: _memo_key(key, file_path, self.__chunk_size, self.__chunk_overlap, self.__chunking_strategy)
+            for file_path, key in source_keys.items()
+        }
+        cached_map = {}
+        if self.__use_cache:
+            for file_path, key in memo_keys.items():
+                memo_docs = _memo_get(key)
+                if memo_docs:
+                    cached_map[source_keys[file_path]] = memo_docs
+
+            db_misses = [key for key in source_keys.values() if key not in cached_map]
+            if db_misses:
+                with app.app_context():
+                    db_cached = DocumentRepository.get_cached_documents_bulk(
+                        db_misses,
+                        self.__chunk_size,
+                        self.__chunk_overlap,
+                        self.__chunking_strategy
+                    )
+                cached_map.update(db_cached)
+                for file_path, key in memo_keys.items():
+                    if source_keys[file_path] in db_cached:
+                        _memo_put(key, db_cached[source_keys[file_path]])
+
+        cpu_batch, io_batch, prompt_batch = [], [], []
+        for file_path in memo_keys:
+
+            cached_docs = cached_map.get(source_keys[file_path])
+            if cached_docs:
+                self.__documents.extend(cached_docs)
+                continue
 
             logging.info(f"Loading document: {file_path}")
-            # load_doc now handles caching and splitting internally
-            self.__documents.extend(self.__load_doc(file_path))
+            if is_cpu_bound(file_path):
+                cpu_batch.append(file_path)
+            elif is_youtube_url(file_path):
+                prompt_batch.append(file_path)
+            else:
+                io_batch.append(file_path)
+
+        workers = _number_of_workers()
+        chunking = dict(
+            chunk_size=self.__chunk_size,
+            chunk_overlap=self.__chunk_overlap,
+            chunking_strategy=self.__chunking_strategy
+        )
+        parse = partial(parse_source, **chunking)
+
+        # Large batches of PDF/PPTX/DOCX go to the shared process pool, and are submitted before
+        # the URL/audio threads start so both overlap; small batches are parsed on the threads.
+        cpu_results = None
+        if len(cpu_batch) >= _PROCESS_POOL_MIN_SOURCES:
+            cpu_results = _get_process_pool().map(parse, cpu_batch, chunksize=4)
+
+        with ThreadPoolExecutor(max_workers=2 * workers) as pool:
+            threaded_results = pool.map(parse, io_batch if cpu_results is not None else cpu_batch + io_batch)
+            # YouTube transcription waits for a confirmation on stdin, so those sources are parsed
+            # one at a time on this thread (never two prompts at once) while the pool runs the rest.
+            prompted_results = [parse(file_path) for file_path in prompt_batch]
+
+            if cpu_results is None:
+                results = list(threaded_results)
+            else:
+                try:
+                    results = list(cpu_results)
+                except BrokenProcessPool as e:
+                    logging.warning(f"Document parser processes failed ({e}); parsing on threads instead.")
+                    _discard_process_pool()
+                    results = list(pool.map(parse, cpu_batch))
+                results.extend(threaded_results)
+            results.extend(prompted_results)
+
+        for file_path, (cache_key, split_documents) in zip(cpu_batch + io_batch + prompt_batch, results):
+            self.__documents.extend(split_documents)
+            if self.__use_cache and split_documents:
+                self.__save_cached(cache_key, split_documents)
+                _memo_put(memo_keys[file_path], split_documents)
         
+        # The token count is only logged; do the (networked) count off the loading path.
+        # The list is snapshotted so later loads cannot change it under the thread.
+        threading.Thread(
+            target=self._log_token_count,
+            args=(list(self.__documents),),
+            daemon=True
+        ).start()
+
+    @staticmethod
+    def _log_token_count(documents: List[Document]):
         try:
-            document_token_count = count_tokens_anthropic(messages=self.__documents)
+            document_token_count = count_tokens_anthropic(messages=documents)
             logging.info(f"Total document token count for anthropic: {document_token_count}")
         except Exception:
             logging.warning("Failed to count document tokens.")
-            document_token_count = 0
 
-    def __chunk_documents(self, documents: List[Document]) -> List[Document]:
+    async def aload_docs(self, 
+                         document_paths: Union[List[Union[str, Path]], None] = None) -> List[Document]:
         """
-        This function splits the documents into smaller chunks using langchain text splitters.
+        Awaitable variant of load_docs for async callers.
+        The whole pipeline runs in a worker thread so the event loop is never blocked; inside it
+        URL and audio sources are already transcribed concurrently by the loader thread pool.
         """
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.__chunk_size,
-            chunk_overlap=self.__chunk_overlap,
-            length_function=len,
-            is_separator_regex=False,
-        )
-
-        doc_splits = text_splitter.split_documents(documents)
-        
-        if doc_splits:
-            some_characters = doc_splits[0].page_content.strip()[:1000]
-            some_characters = some_characters.replace("\n", " ").replace("\r", " ")
-            logging.info(f"Split into {len(doc_splits)} documents: {some_characters}")
-        else:
-            logging.warning("No documents were split.")
-        
-        return doc_splits
+        await asyncio.to_thread(self.load_docs, document_paths)
+        return self.documents
@@ -0,0 +1,152 @@
+"""
+Parsing and splitting of a single document source.
+
+This module deliberately imports nothing from the Flask app, the database or the model clients:
+spawned worker processes of the document loader import it on start-up, and that import has to stay cheap.
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Literal, Tuple, Union
+
+from langchain_community.document_loaders import (
+    PyPDFLoader,
+    UnstructuredPowerPointLoader,
+    UnstructuredWordDocumentLoader
+)
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from doc_loader.load_video_audio import transcribe_audio
+from doc_loader.load_url import transcribe_url
+
+
+LOADER_MAP = {
+    ".pdf": PyPDFLoader,
+    ".pptx": UnstructuredPowerPointLoader,
+    ".docx": UnstructuredWordDocumentLoader,
+}
+AUDIO_VIDEO_SUFFIXES = frozenset({".mp4", ".mp3", ".wav", ".m4a", ".avi", ".mov"})
+
+
+ChunkingStrategy = Literal["fixed", "recursive"]
+
+# Separators of the "recursive" (structure-aware) strategy, tried in order: Markdown headings,
+# paragraphs, lines, sentence ends, words. The lookarounds keep headings and sentence-final
+# punctuation with their own chunk.
+STRUCTURED_SEPARATORS = [
+    r"\n(?=#{1,6} )",
+    r"\n\s*\n",
+    r"\n",
+    r"(?<=[.!?])\s+",
+    r"\s+",
+    "",
+]
+
+
+def is_url(file_path: Union[str, Path]) -> bool:
+    return isinstance(file_path, str) and file_path.lower().startswith("http")
+
+
+def canonical_source(file_path: Union[str, Path]) -> str:
+    """
+    Key of a source for de-duplication and the document caches: lower-cased URL, or the resolved
+    local path.
+    """
+    if is_url(file_path):
+        return file_path.lower()
+    return str(Path(file_path).resolve())
+
+
+def is_cpu_bound(file_path: Union[str, Path]) -> bool:
+    """PDF/PPTX/DOCX parsing is CPU bound; URLs and audio/video transcription mostly wait on I/O."""
+    return not is_url(file_path) and Path(file_path).suffix.lower() in LOADER_MAP
+
+
+@lru_cache(maxsize=8)
+def _get_text_splitter(chunk_size: int, chunk_overlap: int,
+                       chunking_strategy: ChunkingStrategy = "fixed") -> RecursiveCharacterTextSplitter:
+    """
+    One splitter per chunk configuration, reused across documents (splitting keeps no state).
+    The builtin len is kept as length_function: it is already the cheapest call for a str.
+    
+    "fixed" uses the splitter's default separators (paragraphs, lines, words); "recursive" first
+    breaks at headings and falls back to sentence ends before words (see STRUCTURED_SEPARATORS),
+    so chunks follow the document structure and fewer of them are cut mid-section or mid-sentence.
+    """
+    if chunking_strategy == "recursive":
+        return RecursiveCharacterTextSplitter(
+            separators=STRUCTURED_SEPARATORS,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=len,
+            is_separator_regex=True,
+        )
+    
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        is_separator_regex=False,
+    )
+
+
+def _iter_chunks(documents: List[Document], chunk_size: int, chunk_overlap: int,
+                 chunking_strategy: ChunkingStrategy = "fixed") -> Iterator[Document]:
+    """
+    Yield the chunks of each document one at a time.
+    Unlike split_documents, no intermediate text/metadata lists are built and the metadata is
+    shallow-copied per chunk instead of deep-copied.
+    """
+    text_splitter = _get_text_splitter(chunk_size, chunk_overlap, chunking_strategy)
+    for document in documents:
+        for text in text_splitter.split_text(document.page_content):
+            yield Document(page_content=text, metadata=dict(document.metadata))
+
+
+def _chunk_documents(documents: List[Document], chunk_size: int, chunk_overlap: int,
+                     chunking_strategy: ChunkingStrategy = "fixed") -> List[Document]:
+    """
+    This function splits the documents into smaller chunks using langchain text splitters.
+    """
+    doc_splits = list(_iter_chunks(documents, chunk_size, chunk_overlap, chunking_strategy))
+    
+    if doc_splits:
+        some_characters = doc_splits[0].page_content.strip()[:1000]
+        some_characters = some_characters.replace("\n", " ").replace("\r", " ")
+        logging.info(f"Split into {len(doc_splits)} documents: {some_characters}")
+    else:
+        logging.warning("No documents were split.")
+    
+    return doc_splits
+
+
+def parse_source(file_path: Union[str, Path], chunk_size: int, chunk_overlap: int,
+              chunking_strategy: ChunkingStrategy = "fixed") -> Tuple[str, List[Document]]:
+    """
+    This function detects the file format, loads it into langchain documents using an appropriate
+    langchain module and splits them. It does not touch the Flask app or the database, so it can
+    run in a worker thread or a spawned worker process.
+    Returns the cache key of the source (see canonical_source) together with the split documents.
+    """
+
+    # Handle URLs separately
+    if is_url(file_path):
+        raw_documents = transcribe_url(file_path)
+    else:
+        # Handle file paths
+        file_path = Path(file_path).resolve()
+        raw_documents = []
+        suffix = file_path.suffix.lower()
+        loader_cls = LOADER_MAP.get(suffix)
+
+        if loader_cls:
+            try:
+                raw_documents = loader_cls(str(file_path)).load()
+            except Exception as e:
+                logging.info(f"Error loading {file_path}: {e}")
+
+        elif suffix in AUDIO_VIDEO_SUFFIXES:
+            raw_documents = transcribe_audio(file_path)
+
+    return canonical_source(file_path), _chunk_documents(raw_documents, chunk_size, chunk_overlap, chunking_strategy)
@@ -2,7 +2,7 @@ import logging
 import hashlib
 from typing import List, Dict, Any
 from datetime import datetime
-from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy import JSON, Column, DateTime, Integer, String, select
 from initialize_app.create_app import SQLALCHEMY_DB, INITIALIZED_FLASK_APP as app
 from langchain_core.documents import Document
 from models.anthropic.token_counter import count_tokens_anthropic
@@ -38,9 +38,15 @@ class DocumentRepository(SQLALCHEMY_DB.Model):
         self.token_count = kwargs.get("token_count", 0)
 
     @staticmethod
-    def _generate_source_hash(source_path: str, chunk_size: int, chunk_overlap: int) -> str:
-        """Generate a unique hash for the source path and chunking parameters."""
+    def _generate_source_hash(source_path: str, chunk_size: int, chunk_overlap: int,
+                              chunking_strategy: str = "fixed") -> str:
+        """
+        Generate a unique hash for the source path and chunking parameters.
+        The default "fixed" strategy is left out of the hash, so records cached before strategies existed still match.
+        """
         hash_input = f"{source_path}:{chunk_size}:{chunk_overlap}"
+        if chunking_strategy != "fixed":
+            hash_input += f":{chunking_strategy}"
         return hashlib.sha256(hash_input.encode()).hexdigest()
 
     @staticmethod
@@ -69,13 +75,13 @@ class DocumentRepository(SQLALCHEMY_DB.Model):
 
     @classmethod
     def get_cached_documents(cls, source_path: str, chunk_size: int = 1000, 
-                           chunk_overlap: int = 200) -> List[Document] | None:
+                           chunk_overlap: int = 200, chunking_strategy: str = "fixed") -> List[Document] | None:
         """
         Retrieve cached split documents for a given source.
         Returns List[Document] if found, None otherwise.
         """
         try:
-            source_hash = cls._generate_source_hash(source_path, chunk_size, chunk_overlap)
+            source_hash = cls._generate_source_hash(source_path, chunk_size, chunk_overlap, chunking_strategy)
             record = cls.query.filter(cls.source_hash == source_hash).first()
             
             if record:
@@ -89,15 +95,44 @@ class DocumentRepository(SQLALCHEMY_DB.Model):
             logging.error(f"Error retrieving cached documents for {source_path}: {e}")
             return None
 
+    @classmethod
+    def get_cached_documents_bulk(cls, source_paths: List[str], chunk_size: int = 1000,
+                                  chunk_overlap: int = 200,
+                                  chunking_strategy: str = "fixed") -> Dict[str, List[Document]]:
+        """
+        Retrieve cached split documents for many sources with a single query.
+        Returns a dict mapping each cached source path to its documents; misses are left out.
+        """
+        if not source_paths:
+            return {}
+
+        try:
+            path_by_hash = {
+                cls._generate_source_hash(source_path, chunk_size, chunk_overlap, chunking_strategy): source_path
+                for source_path in source_paths
+            }
+            stmt = select(cls.source_hash, cls.split_documents).where(cls.source_hash.in_(path_by_hash))
+            cached = {
+                path_by_hash[source_hash]: cls._deserialize_documents(split_documents)
+                for source_hash, split_documents in SQLALCHEMY_DB.session.execute(stmt)
+            }
+            logging.info(f"Cache hit for {len(cached)} of {len(path_by_hash)} sources")
+            return cached
+
+        except Exception as e:
+            logging.error(f"Error retrieving cached documents: {e}")
+            return {}
+
     @classmethod
     def save_documents(cls, src_path_or_name: str, documents: List[Document], 
-                      chunk_size: int = 1000, chunk_overlap: int = 200) -> 'DocumentRepository':
+                      chunk_size: int = 1000, chunk_overlap: int = 200,
+                      chunking_strategy: str = "fixed") -> 'DocumentRepository':
         """
         Save split documents to the cache.
         If a record already exists for this source, it will be updated.
         """
         try:
-            source_hash = cls._generate_source_hash(src_path_or_name, chunk_size, chunk_overlap)
+            source_hash = cls._generate_source_hash(src_path_or_name, chunk_size, chunk_overlap, chunking_strategy)
             
             # Check if record exists
             existing_record: DocumentRepository = cls.query.filter(cls.source_hash == source_hash).first()
@@ -131,7 +166,6 @@ class DocumentRepository(SQLALCHEMY_DB.Model):
                 )
                 SQLALCHEMY_DB.session.add(record)
                 SQLALCHEMY_DB.session.commit()
-                SQLALCHEMY_DB.session.refresh(record)
                 logging.info(f"Cached {len(documents)} split documents for {src_path_or_name}")
 
                 
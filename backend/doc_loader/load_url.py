@@ -10,12 +10,17 @@ from langchain_community.document_loaders import YoutubeLoader
 from langchain_core.documents import Document
 
 
+def is_youtube_url(file_path: Union[str, Path]) -> bool:
+    """YouTube sources ask for a confirmation on stdin before they are transcribed."""
+    return isinstance(file_path, str) and ("youtube.com" in file_path.lower() or "youtu.be" in file_path.lower())
+
+
 # Handle URLs separately
 def transcribe_url(file_path: Union[str, Path]) -> List[Document]:
 
     if isinstance(file_path, str) and file_path.lower().startswith("http"):
         # Check if it's a YouTube URL
-        if "youtube.com" in file_path.lower() or "youtu.be" in file_path.lower():
+        if is_youtube_url(file_path):
             # Add delay to avoid rate limiting (YouTube blocks IPs that make too many requests)
             input("Press Enter to proceed with YouTube transcription (ensure you are not making too many requests)...")
             delay = random.uniform(2, 5)  # Random delay between 2-5 seconds
@@ -0,0 +1,91 @@
+"""
+A source loaded once must come back from the document caches on the next load without being
+parsed again: from the in-process memo with no query, or from the SQL cache in one query.
+"""
+
+import threading
+
+import pytest
+from langchain_community.document_loaders import TextLoader
+from langchain_core.documents import Document
+
+from doc_loader import doc_importer, doc_parser
+from doc_loader.doc_importer import DocumentImporter
+from initialize_app.create_app import INITIALIZED_FLASK_APP as app, SQLALCHEMY_DB
+from utils.query_counter import count_queries
+
+
+@pytest.fixture
+def text_source(tmp_path, monkeypatch):
+    # Plain text needs no PDF/Office parser, but goes through the same parse_source path
+    monkeypatch.setitem(doc_parser.LOADER_MAP, ".txt", TextLoader)
+    source = tmp_path / "Shipment Notes.TXT"
+    source.write_text("Shipment 42 left the hub on Monday.\n\nIt arrives on Thursday.\n")
+    yield source
+    DocumentImporter.clear_cache()
+
+
+def _importer(source) -> DocumentImporter:
+    return DocumentImporter(data_sources=[source], chunk_size=40, chunk_overlap=0)
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("source was parsed again instead of read from the cache")
+
+
+def test_reload_hits_sql_cache(text_source, monkeypatch):
+    first = _importer(text_source)
+    first.load_docs()
+    assert first.documents
+
+    # Drop the in-process memo so the reload has to go through the SQL cache
+    DocumentImporter.clear_cache()
+    monkeypatch.setattr(doc_importer, "parse_source", _fail_parse)
+
+    with app.app_context():
+        engine = SQLALCHEMY_DB.engine
+    reloaded = _importer(text_source)
+    with count_queries(engine) as queries:
+        reloaded.load_docs()
+
+    assert [doc.page_content for doc in reloaded.documents] == [doc.page_content for doc in first.documents]
+    assert len(queries) == 1
+
+
+def test_reload_in_process_hits_memo_without_sql(text_source, monkeypatch):
+    first = _importer(text_source)
+    first.load_docs()
+
+    monkeypatch.setattr(doc_importer, "parse_source", _fail_parse)
+    with app.app_context():
+        engine = SQLALCHEMY_DB.engine
+    # The same file given by a differently spelled path is the same source
+    reloaded = _importer(text_source.parent / ".." / text_source.parent.name / text_source.name)
+    with count_queries(engine) as queries:
+        reloaded.load_docs()
+
+    assert [doc.page_content for doc in reloaded.documents] == [doc.page_content for doc in first.documents]
+    assert queries == []
+
+
+def test_youtube_sources_are_parsed_one_at_a_time_on_the_calling_thread(monkeypatch):
+    threads = {}
+
+    def fake_parse(file_path, **chunking):
+        threads[file_path] = threading.current_thread()
+        return doc_parser.canonical_source(file_path), [Document(page_content=file_path)]
+
+    monkeypatch.setattr(doc_importer, "parse_source", fake_parse)
+    sources = ["https://www.youtube.com/watch?v=a", "https://youtu.be/b", "https://example.com/page"]
+    importer = DocumentImporter(data_sources=list(sources), use_cache=False)
+    importer.load_docs()
+
+    assert sorted(doc.page_content for doc in importer.documents) == sorted(sources)
+    assert threads[sources[0]] is threads[sources[1]] is threading.current_thread()
+
+
+def test_cache_key_is_canonical_source(text_source):
+    cache_key, _ = doc_parser.parse_source(text_source, chunk_size=40, chunk_overlap=0)
+
+    assert cache_key == doc_parser.canonical_source(text_source) == str(text_source.resolve())
+    assert doc_parser.canonical_source("https://Example.com/Doc") == "https://example.com/doc"
@@ -6,12 +6,29 @@ import logging
 class Config:
     
     data_dir = Path().resolve() / 'backend' / 'data'
-    data_dir.mkdir(parents=True, exist_ok=True)
-
     db_path = data_dir / 'messages.db'
 
-    if not db_path.exists():
-        logging.info(f"Database file not found. Will create new database at {db_path}")
+    SQLALCHEMY_DATABASE_URI = getenv("DATABASE_URL")
+    if not SQLALCHEMY_DATABASE_URI:
+        # Only the default local database needs the data directory
+        data_dir.mkdir(parents=True, exist_ok=True)
+        if not db_path.exists():
+            logging.info(f"Database file not found. Will create new database at {db_path}")
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
 
-    SQLALCHEMY_DATABASE_URI = getenv("DATABASE_URL") or f"sqlite:///{db_path}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Dev only: warn when a request issues more SQL queries than this (0 disables the check)
+    SQL_QUERY_WARN_THRESHOLD = int(getenv("SQL_QUERY_WARN_THRESHOLD", "0"))
+    # Connections come from the scoped SQLALCHEMY_DB.session, one per request/thread;
+    # recycle them before server-side idle timeouts drop them.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 6,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 300,
+        # Room for every distinct statement shape of the chat/RAG paths in the compiled-SQL cache
+        "query_cache_size": 1200
+    }
+    if SQLALCHEMY_DATABASE_URI.startswith("postgresql+psycopg://"):
+        # psycopg 3 server-side prepares a statement once it has run this many times on a connection
+        SQLALCHEMY_ENGINE_OPTIONS["connect_args"] = {"prepare_threshold": 5}
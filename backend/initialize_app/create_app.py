@@ -1,4 +1,5 @@
 import logging
+import threading
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
@@ -12,6 +13,9 @@ warnings.filterwarnings("ignore")
 class CreateAPP:
     """Singleton class to create and manage the Flask app and Bcrypt instances."""
     _instance = None
+    # Guards first-time creation only; once created, the fast paths are a plain None check.
+    # Re-entrant because __init__/create() run while __new__ may already hold it.
+    _lock = threading.RLock()
     _initialized = False
     _app = None
     _bcrypt = None
@@ -20,18 +24,23 @@ class CreateAPP:
     def __new__(cls):
 
         if cls._instance is None:
-
-            cls._instance = super().__new__(cls)
-            cls._instance._app = None
-            cls._instance._bcrypt = None
-            cls._instance._initialized = False
-            cls._instance.__sqlalchemy_db = None
+            with cls._lock:
+                if cls._instance is None:
+
+                    instance = super().__new__(cls)
+                    instance._app = None
+                    instance._bcrypt = None
+                    instance._initialized = False
+                    instance.__sqlalchemy_db = None
+                    cls._instance = instance
                     
         return cls._instance
     
     def __init__(self):
         if not self._initialized:
-            self.create()
+            with self._lock:
+                if not self._initialized:
+                    self.create()
 
     def reset_instance(self):
         self._initialized = False
@@ -40,18 +49,24 @@ class CreateAPP:
 
     def initialize_flask_app(self):
         if not self._app:
-            self.create()
+            with self._lock:
+                if not self._app:
+                    self.create()
         return self._app
 
     def bcrypt(self):
         if not self._bcrypt:
-            self.create()
+            with self._lock:
+                if not self._bcrypt:
+                    self.create()
         return self._bcrypt
 
     def get_config(self, config_key: str, default: str | None = None) -> str | None:
         
-        if self.is_app_valid():
-            self.create()
+        if not self.is_app_valid():
+            with self._lock:
+                if not self.is_app_valid():
+                    self.create()
         
         try:
             conf = self._app.config.get(config_key)
@@ -64,7 +79,7 @@ class CreateAPP:
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
-            cls._instance = cls()
+            cls()
         return cls._instance
 
     def is_app_valid(self):
@@ -100,7 +115,9 @@ class CreateAPP:
                 }
             })
 
-            self.__sqlalchemy_db = SQLAlchemy()
+            # All column defaults are set in Python, so committed objects are already up to date;
+            # keeping them loaded avoids a SELECT on the next attribute access after each commit.
+            self.__sqlalchemy_db = SQLAlchemy(session_options={"expire_on_commit": False})
             self.__sqlalchemy_db.init_app(flask_app)
             bcrypt = Bcrypt(flask_app)
 
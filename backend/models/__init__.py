@@ -6,4 +6,13 @@
 # llm_basic = init_chat_model(llm_basic)
 # llm_advanced = init_chat_model(llm_advanced)
 
-from models.anthropic import anthropic_basic_model as llm_basic, anthropic_advanced_model as llm_advanced
+def __getattr__(name: str):
+    """Resolve llm_basic / llm_advanced lazily so importing a models submodule does not build the clients."""
+    if name == "llm_basic":
+        from models.anthropic import get_basic_model
+        return get_basic_model()
+    if name == "llm_advanced":
+        from models.anthropic import get_advanced_model
+        return get_advanced_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
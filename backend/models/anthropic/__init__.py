@@ -1,56 +1,78 @@
 import logging
+from functools import cache
 from os import getenv
-from langchain_anthropic import ChatAnthropic
-from utils.dynamic_model_selector import create_dynamic_agent
-from langchain_core.messages import HumanMessage
-# from utils.http_client import HTTP_CLIENT
-from dotenv import load_dotenv
-load_dotenv()
-
-
-# Get API key from environment
-api_key = getenv("ANTHROPIC_API_KEY")
-if not api_key:
-    raise ValueError(
-        "ANTHROPIC_API_KEY not found in environment variables. "
-        "Please create a .env file with ANTHROPIC_API_KEY=your-key-here"
+
+# Models are built on first access (see __getattr__ below), so importing this package, or a
+# submodule such as token_counter, neither needs the API key nor contacts Anthropic.
+
+
+@cache
+def _get_api_key() -> str:
+    """Get API key from environment."""
+    from utils.env import load_env_once
+    load_env_once()
+    api_key = getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "ANTHROPIC_API_KEY not found in environment variables. "
+            "Please create a .env file with ANTHROPIC_API_KEY=your-key-here"
+        )
+    return api_key
+
+
+@cache
+def get_basic_model():
+    from langchain_anthropic import ChatAnthropic
+    # from utils.http_client import HTTP_CLIENT
+
+    return ChatAnthropic(
+        model="claude-haiku-4-5-20251001",
+        temperature=0.7,
+        # max_tokens=2048,  # Increased for news summarization tasks
+        timeout=None,
+        max_retries=2,
+        api_key=_get_api_key()
+        # model_kwargs={ "http_client": HTTP_CLIENT }
+    )
+
+
+@cache
+def get_advanced_model():
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(
+        model="claude-opus-4-1-20250805",
+        temperature=0.2,
+        # max_tokens=2048,
+        timeout=None,
+        max_retries=2,
+        api_key=_get_api_key()
+        # model_kwargs={ "http_client": HTTP_CLIENT }
+    )
+
+
+@cache
+def get_dynamic_agent():
+    from utils.dynamic_model_selector import create_dynamic_agent
+
+    agent = create_dynamic_agent(
+        basic_model=get_basic_model(),
+        advanced_model=get_advanced_model()
     )
+    logging.info("Anthropic models initialized successfully.")
+    return agent
+
+
+_LAZY_ATTRIBUTES = {
+    "anthropic_basic_model": get_basic_model,
+    "anthropic_advanced_model": get_advanced_model,
+    "dynamic_anthropic_agent": get_dynamic_agent,
+}
+
+
+def __getattr__(name: str):
+    """Keep `from models.anthropic import anthropic_basic_model` working, building it on first use."""
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-anthropic_basic_model = ChatAnthropic(
-    model="claude-haiku-4-5-20251001",
-    temperature=0.7,
-    # max_tokens=2048,  # Increased for news summarization tasks
-    timeout=None,
-    max_retries=2,
-    api_key=api_key
-    # model_kwargs={ "http_client": HTTP_CLIENT }
-)
-
-anthropic_advanced_model = ChatAnthropic(
-    model="claude-opus-4-1-20250805",
-    temperature=0.2,
-    # max_tokens=2048,
-    timeout=None,
-    max_retries=2,
-    api_key=api_key
-    # model_kwargs={ "http_client": HTTP_CLIENT }
-)
-
-dynamic_anthropic_agent = create_dynamic_agent(
-    basic_model=anthropic_basic_model,
-    advanced_model=anthropic_advanced_model
-)
-
-logging.info("Anthropic models initialized successfully.") 
-
-
-response = dynamic_anthropic_agent.invoke({
-    "messages": [HumanMessage(content="Hello, Anthropic!")]
-})
-
-if "messages" in response:
-    logging.info("\nResponse:")
-    for msg in response["messages"]:
-        logging.info(f"{msg.type}: {msg.content}")
-else:
-    logging.info(response)
\ No newline at end of file
@@ -0,0 +1,16 @@
+from functools import cache
+from os import getenv
+from anthropic import Anthropic
+
+
+@cache
+def get_client() -> Anthropic:
+    """
+    Process-wide Anthropic SDK client, built on first use.
+    Shares the pooled HTTP_CLIENT so its keep-alive connections are reused across all model calls.
+    """
+    from utils.env import load_env_once
+    from utils.http_client import HTTP_CLIENT
+
+    load_env_once()
+    return Anthropic(api_key=getenv("ANTHROPIC_API_KEY"), http_client=HTTP_CLIENT)
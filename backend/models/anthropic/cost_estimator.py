@@ -11,8 +11,10 @@ Pricing sources (as of December 2025):
 
 from __future__ import annotations
 import logging
-from typing import Dict, Optional, Union, Literal, List
+from typing import Deque, Dict, Optional, Tuple, Union, Literal, List
+from collections import defaultdict, deque
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 
 # Pricing per 1M tokens (input/output) in USD
@@ -39,18 +41,61 @@ PRICING_TABLE = {
     "mixtral-8x7b-32768": {"input": 0.27, "output": 0.27, "provider": "groq"},
 }
 
+# Anthropic prompt caching: cache reads bill at 10% of the input rate, 5-minute cache writes at 125%
+CACHE_READ_MULTIPLIER = 0.1
+CACHE_WRITE_MULTIPLIER = 1.25
 
-@dataclass
+# Precomputed once: used for error messages and by list_available_models
+_AVAILABLE_MODELS_LIST = tuple(PRICING_TABLE.keys())
+_AVAILABLE_MODELS_STR = ", ".join(_AVAILABLE_MODELS_LIST)
+
+_models_by_provider = defaultdict(list)
+for _model, _data in PRICING_TABLE.items():
+    _models_by_provider[_data["provider"]].append(_model)
+_MODELS_BY_PROVIDER = {provider: tuple(models) for provider, models in _models_by_provider.items()}
+del _models_by_provider, _model, _data
+
+# Lower-cased model name -> (model name, pricing), built once for O(1) exact lookups
+_PRICING_LC = {model.lower(): (model, data) for model, data in PRICING_TABLE.items()}
+
+# Model name -> (input, output) USD per token, so the cost is two multiplies with no division
+_RATES = {
+    model: (data["input"] / 1_000_000, data["output"] / 1_000_000)
+    for model, data in PRICING_TABLE.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _match_pricing(model_normalized: str) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    Resolve a normalized model name to its pricing-table entry.
+    Exact names are a single dict hit; otherwise the first table model containing the name
+    (e.g. "sonnet-4-5") is used. Results are cached, so the substring scan runs once per name.
+    """
+    hit = _PRICING_LC.get(model_normalized)
+    if hit:
+        return hit
+
+    partial_key = next((key for key in _PRICING_LC if model_normalized in key), None)
+    return _PRICING_LC[partial_key] if partial_key else (None, None)
+
+
+@dataclass(slots=True, frozen=True)
 class CostEstimate:
-    """Data class for cost estimation results."""
+    """Data class for cost estimation results (immutable, slotted to keep tracked estimates small)."""
     input_tokens: int
     output_tokens: int
     input_cost: float
     output_cost: float
-    total_cost: float
     model: str
     provider: str
     timestamp: datetime
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def total_cost(self) -> float:
+        return self.input_cost + self.output_cost
     
     def __str__(self) -> str:
         """Human-readable string representation."""
@@ -73,6 +118,8 @@ class CostEstimate:
             "model": self.model,
             "provider": self.provider,
             "timestamp": self.timestamp.isoformat(),
+            "cached_tokens": self.cached_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
             "cost_per_1k_tokens": (self.total_cost / (self.input_tokens + self.output_tokens)) * 1000 
                 if (self.input_tokens + self.output_tokens) > 0 else 0
         }
@@ -82,7 +129,9 @@ def estimate_cost(
     input_tokens: int,
     output_tokens: int,
     model: str,
-    provider: Optional[Literal["anthropic", "openai", "groq"]] = None
+    provider: Optional[Literal["anthropic", "openai", "groq"]] = None,
+    cached_tokens: int = 0,
+    cache_write_tokens: int = 0
 ) -> CostEstimate:
     """
     Estimate the cost of an LLM API call based on token usage.
@@ -92,6 +141,8 @@ def estimate_cost(
         output_tokens: Number of output tokens generated
         model: Model name (e.g., "claude-opus-4-1-20250805", "gpt-4o-mini")
         provider: Optional provider name. If not provided, will be inferred from model name
+        cached_tokens: Input tokens read from the prompt cache (billed at CACHE_READ_MULTIPLIER)
+        cache_write_tokens: Input tokens written to the prompt cache (billed at CACHE_WRITE_MULTIPLIER)
         
     Returns:
         CostEstimate object with detailed cost breakdown
@@ -104,50 +155,59 @@ def estimate_cost(
         >>> print(cost)
         >>> print(f"Total cost: ${cost.total_cost:.4f}")
     """
-    # Normalize model name
-    model_normalized = model.strip().lower()
-    
-    # Find exact or partial match in pricing table
-    pricing = None
-    matched_model = None
-    
-    for price_model, price_data in PRICING_TABLE.items():
-        if model_normalized == price_model.lower() or model_normalized in price_model.lower():
-            pricing = price_data
-            matched_model = price_model
-            break
-    
-    if not pricing:
-        # Try to infer provider and suggest similar models
-        available_models = list(PRICING_TABLE.keys())
-        raise ValueError(
-            f"Model '{model}' not found in pricing table. "
-            f"Available models: {', '.join(available_models)}"
-        )
+    input_cost, output_cost, matched_model, detected_provider = _compute_cost(
+        input_tokens, output_tokens, model.strip().lower(), cached_tokens, cache_write_tokens
+    )
     
     # Get provider from pricing data or use provided
-    detected_provider = pricing["provider"]
     if provider and provider != detected_provider:
         logging.warning(
             f"Provided provider '{provider}' does not match detected provider "
             f"'{detected_provider}' for model '{matched_model}'"
         )
     
-    # Calculate costs (pricing is per 1M tokens)
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-    total_cost = input_cost + output_cost
-    
     return CostEstimate(
         input_tokens=input_tokens,
         output_tokens=output_tokens,
         input_cost=input_cost,
         output_cost=output_cost,
-        total_cost=total_cost,
         model=matched_model,
         provider=detected_provider,
-        timestamp=datetime.now()
+        timestamp=datetime.now(),
+        cached_tokens=cached_tokens,
+        cache_write_tokens=cache_write_tokens
+    )
+
+
+@lru_cache(maxsize=4096)
+def _compute_cost(
+    input_tokens: int,
+    output_tokens: int,
+    model_normalized: str,
+    cached_tokens: int = 0,
+    cache_write_tokens: int = 0
+) -> Tuple[float, float, str, str]:
+    """
+    Cost arithmetic for estimate_cost, memoized per token counts and model.
+    Cache reads and writes are billed on top of input_tokens (which excludes them, as reported by the API).
+    Returns an immutable (input_cost, output_cost, matched_model, provider) tuple.
+    """
+    # Find exact or partial match in pricing table
+    matched_model, pricing = _match_pricing(model_normalized)
+    
+    if not pricing:
+        raise ValueError(
+            f"Model '{model_normalized}' not found in pricing table. "
+            f"Available models: {_AVAILABLE_MODELS_STR}"
+        )
+    
+    input_rate, output_rate = _RATES[matched_model]
+    billed_input_tokens = (
+        input_tokens
+        + cached_tokens * CACHE_READ_MULTIPLIER
+        + cache_write_tokens * CACHE_WRITE_MULTIPLIER
     )
+    return billed_input_tokens * input_rate, output_tokens * output_rate, matched_model, pricing["provider"]
 
 
 def get_pricing_info(model: str) -> Dict[str, Union[str, float]]:
@@ -164,17 +224,16 @@ def get_pricing_info(model: str) -> Dict[str, Union[str, float]]:
         >>> info = get_pricing_info("claude-haiku-4-5-20251001")
         >>> print(f"Input cost per 1M tokens: ${info['input']}")
     """
-    model_normalized = model.strip().lower()
-    
-    for price_model, price_data in PRICING_TABLE.items():
-        if model_normalized == price_model.lower() or model_normalized in price_model.lower():
-            return {
-                "model": price_model,
-                "provider": price_data["provider"],
-                "input_per_1m": price_data["input"],
-                "output_per_1m": price_data["output"],
-                "currency": "USD"
-            }
+    price_model, price_data = _match_pricing(model.strip().lower())
+    
+    if price_data:
+        return {
+            "model": price_model,
+            "provider": price_data["provider"],
+            "input_per_1m": price_data["input"],
+            "output_per_1m": price_data["output"],
+            "currency": "USD"
+        }
     
     raise ValueError(f"Model '{model}' not found in pricing table")
 
@@ -217,7 +276,7 @@ def compare_model_costs(
     return sorted(estimates, key=lambda x: x.total_cost)
 
 
-def list_available_models(provider: Optional[str] = None) -> List[str]:
+def list_available_models(provider: Optional[str] = None) -> Tuple[str, ...]:
     """
     List all available models in the pricing table.
     
@@ -225,54 +284,94 @@ def list_available_models(provider: Optional[str] = None) -> List[str]:
         provider: Optional filter by provider ("anthropic", "openai", "groq")
         
     Returns:
-        List of model names
+        Tuple of model names
         
     Example:
         >>> anthropic_models = list_available_models(provider="anthropic")
         >>> print(anthropic_models)
     """
     if provider:
-        return [
-            model for model, data in PRICING_TABLE.items()
-            if data["provider"] == provider.lower()
-        ]
-    return list(PRICING_TABLE.keys())
+        return _MODELS_BY_PROVIDER.get(provider.lower(), ())
+    return _AVAILABLE_MODELS_LIST
 
 
 class CostTracker:
     """Track cumulative costs across multiple API calls."""
     
-    def __init__(self):
-        """Initialize cost tracker."""
-        self.estimates: List[CostEstimate] = []
+    def __init__(self, max_estimates: int = 256):
+        """
+        Initialize cost tracker.
+        Only the latest max_estimates estimates are kept; totals cover every call.
+        """
+        self.estimates: Deque[CostEstimate] = deque(maxlen=max_estimates)
+        self.clear()
+    
+    def clear(self):
+        """Drop all tracked estimates and restart the clock."""
+        self.estimates.clear()
         self.start_time = datetime.now()
+        self._call_count = 0
+        # Running totals, updated per estimate so summaries cost O(models) instead of O(calls)
+        self._total_cost = 0.0
+        self._tokens = {"input": 0, "output": 0}
+        self._by_model = defaultdict(lambda: {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cost": 0.0})
     
     def add_estimate(self, estimate: CostEstimate):
         """Add a cost estimate to the tracker."""
         self.estimates.append(estimate)
+        self._call_count += 1
+
+        total_cost = estimate.total_cost
+        self._total_cost += total_cost
+        self._tokens["input"] += estimate.input_tokens
+        self._tokens["output"] += estimate.output_tokens
+
+        model_totals = self._by_model[estimate.model]
+        model_totals["calls"] += 1
+        model_totals["input_tokens"] += estimate.input_tokens
+        model_totals["output_tokens"] += estimate.output_tokens
+        model_totals["cost"] += total_cost
     
     def add_usage(
         self,
         input_tokens: int,
         output_tokens: int,
         model: str,
-        provider: Optional[str] = None
+        provider: Optional[str] = None,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0
     ):
         """Add a new usage and calculate cost."""
-        estimate = estimate_cost(input_tokens, output_tokens, model, provider)
+        estimate = estimate_cost(input_tokens, output_tokens, model, provider, cached_tokens, cache_write_tokens)
         self.add_estimate(estimate)
         return estimate
     
+    def add_usage_batch(
+        self,
+        input_tokens: List[int],
+        output_tokens: List[int],
+        model: str,
+        provider: Optional[str] = None
+    ) -> List[CostEstimate]:
+        """Add several usages of the same model at once; returns one estimate per (input, output) pair."""
+        estimates = [
+            estimate_cost(inputs, outputs, model, provider)
+            for inputs, outputs in zip(input_tokens, output_tokens, strict=True)
+        ]
+        for estimate in estimates:
+            self.add_estimate(estimate)
+        return estimates
+    
     def get_total_cost(self) -> float:
         """Get total cost across all tracked estimates."""
-        return sum(est.total_cost for est in self.estimates)
+        return self._total_cost
     
     def get_total_tokens(self) -> Dict[str, int]:
         """Get total token counts."""
         return {
-            "input": sum(est.input_tokens for est in self.estimates),
-            "output": sum(est.output_tokens for est in self.estimates),
-            "total": sum(est.input_tokens + est.output_tokens for est in self.estimates)
+            "input": self._tokens["input"],
+            "output": self._tokens["output"],
+            "total": self._tokens["input"] + self._tokens["output"]
         }
     
     def get_summary(self) -> Dict:
@@ -280,25 +379,13 @@ class CostTracker:
         tokens = self.get_total_tokens()
         runtime = (datetime.now() - self.start_time).total_seconds()
         
-        # Group by model
-        by_model = {}
-        for est in self.estimates:
-            if est.model not in by_model:
-                by_model[est.model] = {
-                    "calls": 0,
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "cost": 0.0
-                }
-            by_model[est.model]["calls"] += 1
-            by_model[est.model]["input_tokens"] += est.input_tokens
-            by_model[est.model]["output_tokens"] += est.output_tokens
-            by_model[est.model]["cost"] += est.total_cost
+        # Copies, so callers cannot mutate the running totals
+        by_model = {model: dict(totals) for model, totals in self._by_model.items()}
         
         return {
             "total_cost": self.get_total_cost(),
             "total_tokens": tokens,
-            "total_calls": len(self.estimates),
+            "total_calls": self._call_count,
             "runtime_seconds": runtime,
             "by_model": by_model,
             "start_time": self.start_time.isoformat(),
@@ -5,20 +5,27 @@ Run this script to see the cost estimation module in action:
 """
 
 import logging
+import orjson
 from langchain_core.messages import HumanMessage, AIMessage
 from models.anthropic import (
     count_tokens_anthropic,
     estimate_cost,
     compare_model_costs,
     list_available_models,
-    UsageTracker,
     CostTracker
 )
+from models.anthropic.cost_estimator import get_pricing_info
+from models.anthropic.usage_tracker import create_tracker
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
 
+def _dumps(obj) -> str:
+    """Pretty-print a JSON-serializable object (orjson, 2-space indent)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
 def example_1_basic_cost_estimation():
     """Example 1: Basic cost estimation for a single API call."""
     print("\n" + "="*70)
@@ -42,8 +49,7 @@ def example_1_basic_cost_estimation():
     
     # Show as dictionary
     print("\nAs JSON:")
-    import json
-    print(json.dumps(cost.to_dict(), indent=2))
+    print(_dumps(cost.to_dict()))
 
 
 def example_2_token_counting():
@@ -106,8 +112,11 @@ def example_3_model_comparison():
     print(f"{'Rank':<6} {'Model':<40} {'Cost':>12} {'Provider':<12}")
     print("-" * 75)
     
-    for rank, cost in enumerate(comparisons, 1):
-        print(f"{rank:<6} {cost.model:<40} ${cost.total_cost:>11.4f} {cost.provider:<12}")
+    row_fmt = "{:<6} {:<40} ${:>11.4f} {:<12}".format
+    print("\n".join(
+        row_fmt(rank, cost.model, cost.total_cost, cost.provider)
+        for rank, cost in enumerate(comparisons, 1)
+    ))
     
     # Show savings
     cheapest = comparisons[0]
@@ -126,7 +135,7 @@ def example_4_usage_tracker():
     print("="*70)
     
     # Create tracker
-    tracker = UsageTracker(model="claude-haiku-4-5-20251001")
+    tracker = create_tracker(model="claude-haiku-4-5-20251001")
     
     print("\nSimulating a conversation with multiple turns...\n")
     
@@ -146,11 +155,13 @@ def example_4_usage_tracker():
         }
     ]
     
-    for i, conv in enumerate(conversations, 1):
-        cost = tracker.track_complete_call(
-            input_messages=conv["input"],
-            output_content=conv["output"]
-        )
+    # Tokenize all turns in one pass and record them together
+    costs = tracker.track_batch(
+        input_message_lists=[conv["input"] for conv in conversations],
+        output_contents=[conv["output"] for conv in conversations]
+    )
+    
+    for i, cost in enumerate(costs, 1):
         print(f"Turn {i}: ${cost.total_cost:.6f}")
     
     # Show summary
@@ -203,10 +214,12 @@ def example_6_list_models():
         print(f"{'Model':<40} {'Input/1M':<12} {'Output/1M':<12}")
         print("-" * 70)
         
-        for model in models:
-            from backend.models.anthropic.cost_estimator import get_pricing_info
-            info = get_pricing_info(model)
-            print(f"{model:<40} ${info['input_per_1m']:<11.2f} ${info['output_per_1m']:<11.2f}")
+        pricing = [(model, get_pricing_info(model)) for model in models]
+        row_fmt = "{:<40} ${:<11.2f} ${:<11.2f}".format
+        print("\n".join(
+            row_fmt(model, info['input_per_1m'], info['output_per_1m'])
+            for model, info in pricing
+        ))
 
 
 def example_7_realistic_scenario():
@@ -220,7 +233,7 @@ def example_7_realistic_scenario():
     print("  - Each article output: ~3,000 tokens")
     print("  - Total: 5 articles\n")
     
-    tracker = UsageTracker(model="claude-haiku-4-5-20251001")
+    tracker = create_tracker(model="claude-haiku-4-5-20251001")
     
     # Simulate article generation
     for i in range(5):
@@ -253,9 +266,12 @@ def example_7_realistic_scenario():
     
     comparisons = compare_model_costs(total_input, total_output, models_to_compare)
     
-    for cost in comparisons:
-        savings = comparisons[-1].total_cost - cost.total_cost
-        print(f"  {cost.model:<40} ${cost.total_cost:>8.4f} (save ${savings:.4f})")
+    most_expensive_cost = comparisons[-1].total_cost
+    row_fmt = "  {:<40} ${:>8.4f} (save ${:.4f})".format
+    print("\n".join(
+        row_fmt(cost.model, cost.total_cost, most_expensive_cost - cost.total_cost)
+        for cost in comparisons
+    ))
 
 
 def main():
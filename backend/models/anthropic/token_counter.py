@@ -1,28 +1,148 @@
 import logging
-from anthropic import Anthropic
-from os import getenv
+import os
+import threading
+import orjson
+from collections import OrderedDict
+from functools import cache
+from hashlib import blake2b
 from typing import Dict, List, Union
 from langchain_core.messages import AnyMessage
-from dotenv import load_dotenv
 from langchain_core.documents import Document
 
-load_dotenv()
+try:
+    from ._client import get_client
+except ImportError:
+    from models.anthropic._client import get_client
+
+TOKEN_COUNT_MODEL = "claude-sonnet-4-5"
+DEFAULT_SYSTEM_PROMPT = "You are a scientist."
+
+# Process-local LRU of remote token counts, keyed by a 16-byte digest of the request payload,
+# so repeated prompts (stable system prompts, few-shot prefixes) skip the HTTP round trip.
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_token_count_cache: "OrderedDict[bytes, int]" = OrderedDict()
+_token_count_cache_lock = threading.Lock()
+
+
+def _payload_digest(system: str, tools: list, messages: list) -> bytes:
+    payload = orjson.dumps(
+        [TOKEN_COUNT_MODEL, system, tools, messages],
+        option=orjson.OPT_SORT_KEYS,
+        default=str
+    )
+    return blake2b(payload, digest_size=16).digest()
+
+
+def _clear_token_count_cache():
+    with _token_count_cache_lock:
+        _token_count_cache.clear()
+
+
+# Approximate per-message framing (role markers etc.) added by the API on top of the content
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@cache
+def _get_local_encoding():
+    """
+    Local BPE tokenizer used to approximate Anthropic token counts without a network call.
+    Anthropic does not publish its tokenizer; cl100k_base is a close approximation for English text.
+    Returns None when tiktoken (or its vocabulary file) is unavailable.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logging.warning(f"Local tokenizer unavailable, falling back to a characters/4 estimate: {e}")
+        return None
+
+
+def count_text_tokens(text: str) -> int:
+    """Count the tokens of a piece of text locally (tiktoken, or ~4 characters per token)."""
+    encoding = _get_local_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_text_tokens_batch(texts: List[str]) -> List[int]:
+    """Count the tokens of many texts locally in one multi-threaded tokenizer pass."""
+    encoding = _get_local_encoding()
+    if encoding is None:
+        return [len(text) // 4 for text in texts]
+    return [
+        len(tokens) for tokens in
+        encoding.encode_batch(texts, num_threads=os.cpu_count() or 1, disallowed_special=())
+    ]
+
+
+def _content_text(content) -> str:
+    """Text of a message content, which is either a string or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in content
+        )
+    return str(content)
+
+
+def _count_tokens_local(formatted_messages: List[Dict], system: str, tools: List[Dict]) -> int:
+    total = count_text_tokens(system) if system else 0
+    if tools:
+        total += count_text_tokens(orjson.dumps(tools, default=str).decode("utf-8"))
+    for message in formatted_messages:
+        total += count_text_tokens(_content_text(message.get("content", ""))) + _MESSAGE_OVERHEAD_TOKENS
+    return total
+
+
+def _format_messages(
+    messages: Union[List[Dict[str, str]], List[AnyMessage], List[Document]]
+) -> List[Dict]:
+    """Convert message dicts, LangGraph AnyMessage objects or Documents to Anthropic message dicts."""
+    # Detect input type and convert to required format
+    first_item = messages[0]
+    
+    if isinstance(first_item, Document):
+        # For Document objects, count tokens in page_content
+        # Create a single user message with all document content
+        combined_content = "\n\n".join(doc.page_content for doc in messages)
+        return [{"role": "user", "content": combined_content}]
+        
+    if isinstance(first_item, dict):
+        # Already in correct format
+        return messages
+        
+    if hasattr(first_item, "type") and hasattr(first_item, "content"):
+        # Convert AnyMessage objects (HumanMessage, AIMessage, etc.)
+        return [
+            {
+                "role": "assistant" if msg.type == "ai" else msg.type,
+                "content": msg.content
+            }
+            for msg in messages
+        ]
+
+    raise ValueError(f"Unsupported message type: {type(first_item)}")
 
-# Initialize Anthropic client
-anthropic_client = Anthropic(api_key=getenv("ANTHROPIC_API_KEY"))
 
 def count_tokens_anthropic(
     messages: Union[List[Dict[str, str]], List[AnyMessage], List[Document]], 
     system: str = "",
-    tools: List[Dict[str, str]] = []
+    tools: List[Dict[str, str]] = [],
+    exact: bool = False
 ) -> int:
     """
     Count tokens in messages for Anthropic models.
+    By default the count is computed locally with a BPE tokenizer (an approximation, no network).
+    With exact=True the Anthropic count_tokens API is called instead; those results are memoized.
     
     Args:
         messages: List of message dicts OR LangGraph AnyMessage objects OR LangChain Document objects
         system: System message for context
         tools: List of tool descriptions for context
+        exact: Ask the Anthropic API for the exact count (one HTTPS round trip on a cache miss)
         
     Returns:
         int: Total token count
@@ -32,39 +152,83 @@ def count_tokens_anthropic(
         if not messages:
             return 0
             
-        # Detect input type and convert to required format
-        first_item = messages[0]
-        
-        if isinstance(first_item, Document):
-            # For Document objects, count tokens in page_content
-            # Create a single user message with all document content
-            combined_content = "\n\n".join(doc.page_content for doc in messages)
-            formatted_messages = [{"role": "user", "content": combined_content}]
-            
-        elif isinstance(first_item, dict):
-            # Already in correct format
-            formatted_messages = messages
-            
-        elif hasattr(first_item, "type") and hasattr(first_item, "content"):
-            # Convert AnyMessage objects (HumanMessage, AIMessage, etc.)
-            formatted_messages = [
-                {
-                    "role": "assistant" if msg.type == "ai" else msg.type,
-                    "content": msg.content
-                }
-                for msg in messages
-            ]
-        else:
-            raise ValueError(f"Unsupported message type: {type(first_item)}")
+        formatted_messages = _format_messages(messages)
+
+        if not exact:
+            return _count_tokens_local(formatted_messages, system, tools)
         
-        response = anthropic_client.messages.count_tokens(
-            model="claude-sonnet-4-5",
-            system=system or "You are a scientist.",
+        system = system or DEFAULT_SYSTEM_PROMPT
+        digest = _payload_digest(system, tools, formatted_messages)
+        with _token_count_cache_lock:
+            cached_count = _token_count_cache.get(digest)
+            if cached_count is not None:
+                _token_count_cache.move_to_end(digest)
+                return cached_count
+
+        response = get_client().messages.count_tokens(
+            model=TOKEN_COUNT_MODEL,
+            system=system,
             tools=tools,
             messages=formatted_messages,
         )
+
+        with _token_count_cache_lock:
+            _token_count_cache[digest] = response.input_tokens
+            if len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+                _token_count_cache.popitem(last=False)
         return response.input_tokens
         
     except Exception as e:
         logging.error(f"Error counting tokens: {e}")
-        return 0
\ No newline at end of file
+        return 0
+
+
+# Lets callers (e.g. tests) reset the memoized counts
+count_tokens_anthropic.cache_clear = _clear_token_count_cache
+
+
+def count_tokens_anthropic_batch(
+    batches: List[Union[List[Dict[str, str]], List[AnyMessage], List[Document]]],
+    system: str = "",
+    tools: List[Dict[str, str]] = []
+) -> List[int]:
+    """
+    Count tokens locally for many message lists in one tokenizer pass.
+    All message texts are flattened into a single list and encoded with tiktoken's multi-threaded
+    encode_batch, then the lengths are summed back per message list. The system prompt and tools
+    are shared by every item and only encoded once.
+    
+    Args:
+        batches: List of message lists (each in any format accepted by count_tokens_anthropic)
+        system: System message for context
+        tools: List of tool descriptions for context
+        
+    Returns:
+        list[int]: Token count per message list, in input order
+    """
+    try:
+        texts = []
+        group_sizes = []
+        for messages in batches:
+            formatted_messages = _format_messages(messages) if messages else []
+            texts.extend(_content_text(message.get("content", "")) for message in formatted_messages)
+            group_sizes.append(len(formatted_messages))
+
+        shared_tokens = count_text_tokens(system) if system else 0
+        if tools:
+            shared_tokens += count_text_tokens(orjson.dumps(tools, default=str).decode("utf-8"))
+
+        lengths = count_text_tokens_batch(texts)
+
+        counts = []
+        start = 0
+        for size in group_sizes:
+            end = start + size
+            content_tokens = sum(lengths[start:end]) + size * _MESSAGE_OVERHEAD_TOKENS
+            counts.append(shared_tokens + content_tokens if size else 0)
+            start = end
+        return counts
+
+    except Exception as e:
+        logging.error(f"Error counting tokens: {e}")
+        return [0] * len(batches)
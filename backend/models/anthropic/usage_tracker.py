@@ -5,20 +5,27 @@ tracking of LLM API usage and associated costs.
 """
 
 from __future__ import annotations
+import asyncio
 import logging
-from typing import Dict, List, Union, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from os import getenv
+from typing import Deque, Dict, List, Union, Optional
 from langchain_core.messages import AnyMessage
 from langchain_core.documents import Document
 
 try:
-    from .token_counter import count_tokens_anthropic
+    from .token_counter import count_tokens_anthropic, count_tokens_anthropic_batch, count_text_tokens, count_text_tokens_batch
     from .cost_estimator import (
         estimate_cost,
         CostEstimate,
         CostTracker
     )
 except ImportError:
-    from models.anthropic.token_counter import count_tokens_anthropic
+    from models.anthropic.token_counter import count_tokens_anthropic, count_tokens_anthropic_batch, count_text_tokens, count_text_tokens_batch
     from models.anthropic.cost_estimator import (
         estimate_cost,
         CostEstimate,
@@ -26,6 +33,46 @@ except ImportError:
     )
 
 
+# Number of recent call records kept for introspection; totals always cover every call
+_RECENT_CALLS = int(getenv("USAGE_RECENT_N", "256"))
+
+# Counts input tokens off the caller's thread so tokenization overlaps the LLM request
+_TOKENIZE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="token-count")
+
+
+@cache
+def _warn_once(message: str):
+    """Log a warning the first time a given message is seen."""
+    logging.warning(message)
+
+
+@dataclass(slots=True, frozen=True)
+class CallRecord:
+    """Token counts and cost of one tracked API call."""
+    input_tokens: int
+    output_tokens: int
+    cost: float
+    timestamp: datetime
+    model: str
+    from_metadata: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary (the format tracked calls used to be stored in)."""
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "cost": self.cost,
+            "timestamp": self.timestamp,
+            "model": self.model,
+            "from_metadata": self.from_metadata
+        }
+
+
 class UsageTracker:
     """
     Comprehensive tracker for LLM usage combining token counting and cost estimation.
@@ -45,27 +92,42 @@ class UsageTracker:
         >>> # Get summary
         >>> print(tracker.get_summary())
     """
+    __slots__ = (
+        "_cost_tracker",
+        "_calls",
+        "_call_count",
+        "_model",
+        "_provider",
+        "_initialized",
+        "_pending_input_tokens",
+        "_pending_input_batch",
+        "_pending_input_future",
+    )
     _instance = None
-    _model: str = ""
-    _provider: Optional[str] = None
-    _initialized: bool = False
-    _calls: List[Dict] = []
 
     def __new__(cls):
 
         if cls._instance is None:
             cls._instance = super(UsageTracker, cls).__new__(cls)
-            cls._instance._cost_tracker = CostTracker()
-            cls._instance._calls = []
-            cls._instance._model = ""
-            cls._instance._provider = None
-            cls._instance._initialized = False
+            cls._instance._init_once()
 
         return cls._instance
     
     def __init__(self):
        pass
     
+    def _init_once(self):
+        """Set up the tracker state; runs only when the singleton is created."""
+        self._cost_tracker = CostTracker(max_estimates=_RECENT_CALLS)
+        self._calls: Deque[CallRecord] = deque(maxlen=_RECENT_CALLS)
+        self._call_count = 0
+        self._model = ""
+        self._provider = None
+        self._initialized = False
+        self._pending_input_tokens = 0
+        self._pending_input_batch = []
+        self._pending_input_future = None
+    
     @classmethod
     def get_instance(cls):
         """Get singleton instance of UsageTracker."""
@@ -83,14 +145,15 @@ class UsageTracker:
         """
         self._model = model
         self._provider = provider
-        self._cost_tracker = CostTracker()
-        self._calls = []
+        self._cost_tracker.clear()
+        self._calls.clear()
+        self._call_count = 0
         logging.info(f"Re-initialized UsageTracker for model: {model}")
     
     @property
-    def calls(self) -> List[Dict]:
-        """Get list of tracked API calls."""
-        return self._calls
+    def calls(self) -> List[CallRecord]:
+        """Get the most recent tracked API calls (up to USAGE_RECENT_N)."""
+        return list(self._calls)
 
     def track_input(
         self,
@@ -111,10 +174,76 @@ class UsageTracker:
         """
         input_tokens = count_tokens_anthropic(messages, system, tools)
         
-        # Store for later completion
+        # Store for later completion; the latest tracked input replaces any earlier pending one
         self._pending_input_tokens = input_tokens
+        self._pending_input_future = None
+        self._pending_input_batch = []
         
-        logging.debug(f"Tracked input: {input_tokens} tokens")
+        logging.debug("Tracked input: %d tokens", input_tokens)
+        return input_tokens
+    
+    def track_input_async(
+        self,
+        messages: Union[List[Dict[str, str]], List[AnyMessage], List[Document]],
+        system: str = "",
+        tools: List[Dict[str, str]] = []
+    ) -> Future:
+        """
+        Start counting input tokens on a background thread and return immediately, so the API
+        call can be sent while the request is tokenized. The next track_output waits for the count.
+        
+        Args:
+            messages: Messages to send to the API
+            system: System message
+            tools: Tool descriptions
+            
+        Returns:
+            Future resolving to the number of input tokens
+        """
+        future = _TOKENIZE_EXECUTOR.submit(count_tokens_anthropic, messages, system, tools)
+        # Replaces any earlier pending input, including the rest of a queued batch
+        self._pending_input_future = future
+        self._pending_input_tokens = 0
+        self._pending_input_batch = []
+        return future
+    
+    async def atrack_input(
+        self,
+        messages: Union[List[Dict[str, str]], List[AnyMessage], List[Document]],
+        system: str = "",
+        tools: List[Dict[str, str]] = []
+    ) -> int:
+        """Async variant of track_input; tokenizes in a worker thread instead of blocking the event loop."""
+        return await asyncio.to_thread(self.track_input, messages, system, tools)
+    
+    def track_input_batch(
+        self,
+        message_lists: List[Union[List[Dict[str, str]], List[AnyMessage], List[Document]]],
+        system: str = "",
+        tools: List[Dict[str, str]] = []
+    ) -> List[int]:
+        """
+        Track input tokens for several upcoming requests at once.
+        The counts are computed in one tokenizer pass and queued; each following track_output
+        call consumes the next queued count, in order.
+        
+        Args:
+            message_lists: Messages for each upcoming API call
+            system: System message
+            tools: Tool descriptions
+            
+        Returns:
+            Number of input tokens per request
+        """
+        input_tokens = count_tokens_anthropic_batch(message_lists, system, tools)
+        
+        # Stored reversed so track_output can pop the next count from the end
+        self._pending_input_batch = input_tokens[::-1]
+        self._pending_input_tokens = 0
+        self._pending_input_future = None
+        
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Tracked input batch: %d requests, %d tokens", len(input_tokens), sum(input_tokens))
         return input_tokens
     
     def track_output(self, output_content: str, model: str | None = None) -> CostEstimate:
@@ -130,8 +259,14 @@ class UsageTracker:
         # Count output tokens (approximate)
         output_tokens = self._estimate_output_tokens(output_content)
         
-        # Get input tokens from pending
-        input_tokens = getattr(self, '_pending_input_tokens', 0)
+        # Get input tokens from pending (only the most recently tracked input source is set)
+        if self._pending_input_batch:
+            input_tokens = self._pending_input_batch.pop()
+        elif self._pending_input_future is not None:
+            input_tokens = self._pending_input_future.result()
+            self._pending_input_future = None
+        else:
+            input_tokens = self._pending_input_tokens
         
         # Calculate cost
         cost = self._cost_tracker.add_usage(
@@ -142,14 +277,14 @@ class UsageTracker:
         )
         
         # Record the call
-        self._calls.append({
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "total_tokens": input_tokens + output_tokens,
-            "cost": cost.total_cost,
-            "timestamp": cost.timestamp,
-            "model": model if model is not None else self._model
-        })
+        self._call_count += 1
+        self._calls.append(CallRecord(
+            input_tokens,
+            output_tokens,
+            cost.total_cost,
+            cost.timestamp,
+            model if model is not None else self._model
+        ))
         
         # Clear pending
         self._pending_input_tokens = 0
@@ -182,9 +317,50 @@ class UsageTracker:
         Returns:
             CostEstimate for this API call
         """
+        # The output is already known, so there is no API call to overlap the tokenization with
         self.track_input(input_messages, system, tools)
         return self.track_output(output_content=output_content, model=model)
     
+    def track_batch(
+        self,
+        input_message_lists: List[Union[List[Dict[str, str]], List[AnyMessage], List[Document]]],
+        output_contents: List[str],
+        system: str = "",
+        tools: List[Dict[str, str]] = [],
+        model: str | None = None
+    ) -> List[CostEstimate]:
+        """
+        Track several complete API calls (e.g. replaying a conversation) at once.
+        Inputs and outputs are each tokenized in a single batch pass.
+        
+        Args:
+            input_message_lists: Input messages of each call
+            output_contents: Generated output of each call
+            system: System message
+            tools: Tool descriptions
+            model: Optional model name
+            
+        Returns:
+            CostEstimate per API call, in order
+        """
+        model_name = model if model is not None else self._model
+        input_tokens = count_tokens_anthropic_batch(input_message_lists, system, tools)
+        output_tokens = count_text_tokens_batch(output_contents)
+        
+        costs = self._cost_tracker.add_usage_batch(input_tokens, output_tokens, model_name, self._provider)
+        self._call_count += len(costs)
+        self._calls.extend(
+            CallRecord(cost.input_tokens, cost.output_tokens, cost.total_cost, cost.timestamp, model_name)
+            for cost in costs
+        )
+        
+        logging.info(
+            f"API calls completed - {len(costs)} calls, Input: {sum(input_tokens)}, "
+            f"Output: {sum(output_tokens)}, Cost: ${sum(cost.total_cost for cost in costs):.6f}"
+        )
+        
+        return costs
+    
     def track_with_response_metadata(
         self,
         input_messages: Union[List[Dict[str, str]], List[AnyMessage], List[Document]],
@@ -212,13 +388,17 @@ class UsageTracker:
             ... )
         """
         # Try to get token counts from metadata
-        input_tokens = response_metadata.get('usage', {}).get('input_tokens')
-        output_tokens = response_metadata.get('usage', {}).get('output_tokens')
+        usage = response_metadata.get('usage', {})
+        input_tokens = usage.get('input_tokens')
+        output_tokens = usage.get('output_tokens')
+        # Prompt-cache reads/writes are reported separately from input_tokens and billed differently
+        cached_tokens = usage.get('cache_read_input_tokens') or 0
+        cache_write_tokens = usage.get('cache_creation_input_tokens') or 0
         
-        # Fallback to counting if not in metadata
+        # Fallback to counting locally (no API call) if not in metadata
         if input_tokens is None:
+            _warn_once("Input tokens not in response metadata, counting them locally")
             input_tokens = count_tokens_anthropic(input_messages, system, tools)
-            logging.debug("Input tokens not in metadata, counted manually")
         
         if output_tokens is None:
             # This shouldn't happen with proper response metadata
@@ -230,18 +410,21 @@ class UsageTracker:
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             model=self._model,
-            provider=self._provider
+            provider=self._provider,
+            cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens
         )
         
         # Record the call
-        self._calls.append({
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "total_tokens": input_tokens + output_tokens,
-            "cost": cost.total_cost,
-            "timestamp": cost.timestamp,
-            "from_metadata": True
-        })
+        self._call_count += 1
+        self._calls.append(CallRecord(
+            input_tokens,
+            output_tokens,
+            cost.total_cost,
+            cost.timestamp,
+            self._model,
+            from_metadata=True
+        ))
         
         logging.info(
             f"API call completed (from metadata) - Input: {input_tokens}, "
@@ -254,7 +437,8 @@ class UsageTracker:
         """
         Estimate output tokens from text.
         
-        This is a rough estimation. For accurate counts, use response metadata.
+        Counted with the local tokenizer, which approximates Anthropic's. For exact counts,
+        use response metadata.
         
         Args:
             text: Output text
@@ -262,8 +446,7 @@ class UsageTracker:
         Returns:
             Estimated token count
         """
-        # Rough estimation: ~4 characters per token on average
-        return len(text) // 4
+        return count_text_tokens(text)
     
     def get_summary(self) -> Dict:
         """Get comprehensive summary of usage and costs."""
@@ -275,21 +458,23 @@ class UsageTracker:
     
     def get_call_count(self) -> int:
         """Get number of API calls tracked."""
-        return len(self._calls)
+        return self._call_count
     
     def get_average_cost_per_call(self) -> float:
         """Get average cost per API call."""
-        if not self._calls:
+        if not self._call_count:
             return 0.0
-        return self.get_total_cost() / len(self._calls)
+        return self.get_total_cost() / self._call_count
     
     def reset(self):
         """Reset the tracker."""
-        self._cost_tracker = CostTracker()
-        self._calls = []
+        self._cost_tracker.clear()
+        self._calls.clear()
+        self._call_count = 0
         self._pending_input_tokens = 0
+        self._pending_input_batch = []
+        self._pending_input_future = None
         logging.info("UsageTracker reset")
-        self._instance = None
     
     def __str__(self) -> str:
         """Human-readable summary."""
@@ -300,7 +485,7 @@ USAGE_TRACKER_INSTANCE = UsageTracker.get_instance()
 
 def create_tracker(model: str, provider: Optional[str] = None) -> UsageTracker:
     """
-    Convenience function to create a usage tracker.
+    Convenience function to (re-)initialize the shared usage tracker.
     
     Args:
         model: Model name
@@ -309,7 +494,9 @@ def create_tracker(model: str, provider: Optional[str] = None) -> UsageTracker:
     Returns:
         UsageTracker instance
     """
-    return UsageTracker(model=model, provider=provider)
+    tracker = UsageTracker.get_instance()
+    tracker.initialize(model, provider)
+    return tracker
 
 
 if __name__ == "__main__":
@@ -319,7 +506,7 @@ if __name__ == "__main__":
     print("Usage Tracker - Example\n")
     
     # Create tracker
-    tracker = UsageTracker(model="claude-haiku-4-5-20251001")
+    tracker = create_tracker(model="claude-haiku-4-5-20251001")
     
     # Simulate API call 1
     print("Simulating API call 1...")
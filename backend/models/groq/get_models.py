@@ -1,30 +1,80 @@
 import logging
+import time
+import certifi
+import orjson
 import requests
 import os
-import urllib3
+import ssl
+from requests.adapters import HTTPAdapter
+from utils.env import load_env_once
+
+load_env_once()
+
+GROQ_MODELS_URL = "https://api.groq.com/openai/v1/models"
+MODELS_CACHE_TTL_SECONDS = 300
+# Read once; the key does not change while the process runs
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+# CA bundle used to verify api.groq.com. On the corporate network (TLS inspection) point
+# ROCS_CA_BUNDLE or REQUESTS_CA_BUNDLE at the corporate chain PEM instead of disabling verification.
+# Loaded once per process into a shared SSL context.
+_CA_BUNDLE = os.getenv("ROCS_CA_BUNDLE") or os.getenv("REQUESTS_CA_BUNDLE") or certifi.where()
+_SSL_CONTEXT = ssl.create_default_context(cafile=_CA_BUNDLE)
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools reuse one preloaded SSL context."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = _SSL_CONTEXT
+        return super().init_poolmanager(*args, **kwargs)
+
+
+# Keep-alive session so repeated polls reuse the connection (and its TLS setup)
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("https://", _SSLContextAdapter(pool_connections=4, pool_maxsize=4))
+
+# api_key -> (etag, last_modified, expires_at, list_model_ids) of the last successful fetch
+_models_cache = {}
 
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 def get_groq_models():
     """Fetch and print the list of available GROQ models in a list format"""
 
+    if not GROQ_API_KEY:
+        logging.error("GROQ_API_KEY not found in environment variables.")
+        return []
+
     try:
+        api_key = GROQ_API_KEY
+        etag, last_modified, expires_at, cached_ids = _models_cache.get(api_key, (None, None, 0.0, None))
+        if cached_ids is not None and time.monotonic() < expires_at:
+            return list(cached_ids)
+
         logging.info("Fetching GROQ models...")
-        api_key = os.environ["GROQ_API_KEY"]
-        url = "https://api.groq.com/openai/v1/models"
-        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-        # Disable SSL verification for corporate network
-        response = requests.get(url, headers=headers, verify=False)
-        list_models = response.json()['data']
-        list_model_ids = [dct['id'] for dct in list_models]
-
-    except KeyError:
-        logging.error("GROQ_API_KEY not found in environment variables.")
-        list_model_ids = []
+        headers = {"Authorization": f"Bearer {api_key}"}
+        # Revalidate a stale list instead of downloading the catalog again
+        if cached_ids is not None:
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = _SESSION.get(GROQ_MODELS_URL, headers=headers, timeout=10)
+
+        if response.status_code == 304 and cached_ids is not None:
+            list_model_ids = cached_ids
+        else:
+            response.raise_for_status()
+            list_model_ids = [dct['id'] for dct in orjson.loads(response.content)['data']]
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        _models_cache[api_key] = (etag, last_modified, time.monotonic() + MODELS_CACHE_TTL_SECONDS, list_model_ids)
 
     except Exception as e:
-        logging.error(f"Error fetching GROQ models: {e}")
+        logging.error("Error fetching GROQ models: %s", e)
         list_model_ids = []
 
-    return list_model_ids
+    return list(list_model_ids)
@@ -1,36 +1,29 @@
 from utils.dynamic_model_selector import create_dynamic_agent
-from utils.http_client import ASYNC_HTTP_CLIENT, HTTP_CLIENT
+from utils.http_client import ASYNC_HTTP_CLIENT, HTTP_CLIENT, create_async_http_client
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
+import asyncio
 import logging
 from os import getenv
-from dotenv import load_dotenv
-load_dotenv(override=True)
+from utils.env import load_env_once
+load_env_once(override=True)
 
 
 def setup_openai_llms():
     """Initialize LLM models based on available OPENAI_API keys if available."""
     basic_llm, advanced_llm = None, None
+    api_key = getenv('OPENAI_API_KEY')
 
-    if getenv('OPENAI_API_KEY'):
+    if api_key:
 
         try:
             basic_llm = ChatOpenAI(
                 model="gpt-4o-mini",
-                api_key=getenv('OPENAI_API_KEY'),
+                api_key=api_key,
                 http_client=HTTP_CLIENT,
                 http_async_client=ASYNC_HTTP_CLIENT
             )
 
-            # print(getenv('OPENAI_API_KEY'))
-            # res = basic_llm.invoke("Hello, Basic OpenAI!")
-            # if res.content:
-            #     logging.info(f"Basic OpenAI LLM response received: {res.content}")
-            # else:
-            #     raise ValueError("No content received from Basic OpenAI LLM invocation.")
-            
-            # input("Press Enter to continue...")
-
         except Exception as e:
             logging.error(f"Error invoking OpenAI: basic_llm: {e}")
             basic_llm = None
@@ -38,7 +31,7 @@ def setup_openai_llms():
         try:
             advanced_llm = ChatOpenAI(
             model="gpt-5",
-            api_key=getenv('OPENAI_API_KEY'),
+            api_key=api_key,
             http_client=HTTP_CLIENT,
             http_async_client=ASYNC_HTTP_CLIENT
             )
@@ -54,22 +47,61 @@ def setup_openai_llms():
 
     return basic_llm, advanced_llm
 
+async def _aprobe_llms(*llms: ChatOpenAI) -> list:
+    """
+    Send a ping to every model concurrently; failures are returned rather than raised.
+    The probe runs on a client of its own: the loop is closed right after, and connections it left in
+    the shared ASYNC_HTTP_CLIENT pool would fail later async callers with "Event loop is closed".
+    """
+    async with create_async_http_client() as client:
+        probes = [
+            ChatOpenAI(
+                model=llm.model_name,
+                api_key=llm.openai_api_key,
+                base_url=llm.openai_api_base,
+                http_client=HTTP_CLIENT,
+                http_async_client=client
+            )
+            for llm in llms
+        ]
+        return await asyncio.gather(
+            *(probe.ainvoke([HumanMessage(content="ping")]) for probe in probes),
+            return_exceptions=True
+        )
+
+
+def probe_openai_llms(*llms: ChatOpenAI) -> bool:
+    """
+    Health-check the given OpenAI models with one overlapping request each. Returns True when
+    every model answered with content.
+    """
+    results = asyncio.run(_aprobe_llms(*llms))
+
+    healthy = True
+    for llm, result in zip(llms, results):
+        if isinstance(result, Exception):
+            logging.error(f"Error invoking OpenAI: {llm.model_name}: {result}")
+            healthy = False
+        elif not result.content:
+            logging.error(f"No content received from OpenAI LLM invocation: {llm.model_name}")
+            healthy = False
+        else:
+            logging.info(f"OpenAI LLM {llm.model_name} response received: {result.content}")
+
+    return healthy
+
+
+def probe_openai() -> bool:
+    """Explicit health check of the configured OpenAI models; importing this module makes no API call."""
+    llms = [llm for llm in (openai_basic, openai_advanced) if llm is not None]
+    if not llms:
+        logging.warning("OpenAI models are not initialized. Cannot test them.")
+        return False
+
+    logging.info("Testing OpenAI models...")
+    return probe_openai_llms(*llms)
+
+
 openai_basic, openai_advanced = setup_openai_llms()
 
 dynamic_openai_agent = create_dynamic_agent(basic_model=openai_basic, advanced_model=openai_advanced)
-
-logging.info("Testing OpenAI dynamic agent...")
-if openai_basic is None:
-    logging.warning("OpenAI basic model is not initialized. Cannot test dynamic agent.")
-    raise ValueError("OpenAI basic model is not initialized. Cannot test dynamic agent.")
-
-response = dynamic_openai_agent.invoke({
-    "messages": [HumanMessage(content="Hello, OpenAI!")]
-})
-
-if "messages" in response:
-    logging.info("\nResponse:")
-    for msg in response["messages"]:
-        logging.info(f"{msg.type}: {msg.content}")
-else:
-    logging.info(response)
\ No newline at end of file
@@ -16,14 +16,7 @@ Usage:
 
 import argparse
 import logging
-from api.interactive_chat import start_interactive_chat
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(name)s | %(asctime)s | %(levelname)s | %(module)s | %(funcName)s | %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+import os
 
 def main():
     parser = argparse.ArgumentParser(description="Interactive Chat with History and RAG")
@@ -43,6 +36,16 @@ def main():
     
     args = parser.parse_args()
     
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(name)s | %(asctime)s | %(levelname)s | %(module)s | %(funcName)s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    
+    # Imported after argument parsing so --help and usage errors return without loading LangChain
+    from api.interactive_chat import start_interactive_chat
+    
     print(f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║          ROCS COPILOT - Interactive Chat                     ║
@@ -51,6 +54,11 @@ Mode: {args.mode.upper()}
 {"Conversation ID: " + args.conversation_id if args.conversation_id else "New Conversation"}
 """)
     
+    # Opt-in provider health check; off by default so startup makes no extra API calls
+    if args.mode == "agent" and os.getenv("ROCS_STARTUP_PROBE"):
+        from models.open_ai import probe_openai
+        probe_openai()
+    
     start_interactive_chat(mode=args.mode, conversation_id=args.conversation_id)
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import cached_property
 import logging
 from typing import Dict, List
 from langgraph.prebuilt import ToolNode, tools_condition
@@ -7,13 +8,14 @@ from langgraph.prebuilt import ToolNode, tools_condition
 class Tools():
     """Singleton class to manage registered tools."""
     _instance = None
-    __tools: Dict = defaultdict(List[ToolNode])
+    # category -> {tool name -> tool}, so duplicate checks are a dict lookup
+    __tools: Dict[str, Dict[str, ToolNode]] = defaultdict(dict)
 
     def __new__(cls):
         
         if cls._instance is None:
             cls._instance = super(Tools, cls).__new__(cls)
-            cls._instance.__tools = defaultdict(List[ToolNode])
+            cls._instance.__tools = defaultdict(dict)
         return cls._instance
 
     def __init__(self):
@@ -26,21 +28,22 @@ class Tools():
 
         return cls._instance
     
-    @property
+    @cached_property
     def tools(self) -> Dict[str, List[ToolNode]]:
         """A dictionary of registered tools categorized by type. E.g., 'universal', 'rag', 'outlook', etc."""
-        return self.__tools
+        return {category: list(bucket.values()) for category, bucket in self.__tools.items()}
 
     def register_tool(self, tool, category: str = "universal"):
         try:
-            existing_tools: List[ToolNode] = self.__tools.setdefault(category, [])
-            for t in existing_tools:
-                if t.__name__ == tool.__name__:
-                    return
+            bucket = self.__tools[category]
+            name = tool.__name__
+            if name in bucket:
+                return
             
-            existing_tools.append(tool)
-            self.__tools[category] = existing_tools
-            logging.info(f"Registered tool: {tool.__name__} under category: {category}")
+            bucket[name] = tool
+            # Rebuild the tools view on next access
+            self.__dict__.pop("tools", None)
+            logging.info("Registered tool: %s under category: %s", name, category)
 
         except Exception:
             logging.warning("Tool has no name attribute during registration check.")
@@ -49,4 +52,4 @@ class Tools():
         for tool in tools:
             self.register_tool(tool, category=category)
 
-TOOLS = Tools.get_instance()
\ No newline at end of file
+TOOLS = Tools.get_instance()
@@ -1,8 +1,8 @@
 """Article Generator - Reusable agent for generating professional articles from documents."""
 
 from utils.initialize_logger import initialize_logger
-from dotenv import load_dotenv
-load_dotenv()
+from utils.env import load_env_once
+load_env_once()
 initialize_logger()
 
 # from .article_generator import ArticleGenerator
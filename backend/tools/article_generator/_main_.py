@@ -3,8 +3,9 @@
 
 import logging
 from os import getenv
-from pathlib import Path
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from langchain_anthropic import ChatAnthropic
 from tools.article_generator.article_generator import ArticleGenerator
 from tools.article_generator.article_profiles import AD_HOC_SUMMERIZER as article_profile
@@ -15,69 +16,86 @@ from models.anthropic.usage_tracker import USAGE_TRACKER_INSTANCE
 advanced_llm_name = "claude-opus-4-1-20250805"
 basic_llm_name = "claude-haiku-4-5-20251001"
 
-llm = ChatAnthropic(
-    model=advanced_llm_name,
-    temperature=0.2,
-    # max_tokens=2048,
-    timeout=None,
-    max_retries=2,
-    api_key=getenv("ANTHROPIC_API_KEY")
-    # model_kwargs={ "http_client": HTTP_CLIENT }
-)
-
-logging.info(f"Using LLM model: {llm.model}")
-USAGE_TRACKER_INSTANCE.initialize(model=str(llm.model))
-
-logging.info(f"{str(article_profile['role'])} ...")
-filename = article_profile['filename'] + '-' + 'opus'
-output_path = article_profile['output_path']
-output_path.mkdir(parents=True, exist_ok=True)
-digest_opportunities_focus=article_profile['digest_opportunities_focus']
-
-generator = ArticleGenerator(llm_model=llm)
-generator.initialize(
-    documents=article_profile['documents'],
-    role=article_profile['role'],
-    article_style=article_profile['article_style'],
-    target_audience=article_profile['target_audience'],
-    article_length=article_profile['article_length'],
-    focus_areas=article_profile['focus_areas'],
-    consolidate_docs=article_profile['consolidate_docs']
-)
-
-# Get and save articles
-articles = generator.get_articles()
-logging.info(f"✓ Generated {len(articles)} article(s)\n")
-
-#get executive summary email
-email_summary = ArticleInsightsGenerator().get_key_insights(
-    articles=articles, summary_length=150, max_takeaways=7)
-
-output_path_txt =Path(f'{output_path}/{filename}.txt')
-output_path_txt.write_text(email_summary, encoding='utf-8')
-
-logging.info(f"✓ Executive summary email saved to {output_path_txt}\n")
-
-# Save as Markdown
-generator.save_articles_to_file(f'{output_path}/{filename}.md', format='markdown')
-logging.info(f"✓ Saved to {output_path}/{filename}.md\n")
-
-# Save as DOCX for LinkedIn
-generator.save_articles_to_file(f'{output_path}/{filename}.docx', format='docx')
-logging.info(f"✓ Saved to {output_path}/{filename}.docx (ready for LinkedIn)\n")
-
-# Generate digest
-logging.info(f"Generating digest focused on {digest_opportunities_focus} ...")
-digest = generator.get_digest(digest_focus=digest_opportunities_focus)
-
-# Save digest
-with open(f'{output_path}/digest_{filename}.md', 'w', encoding='utf-8') as f:
-    f.write(digest)
-logging.info(f"✓ Digest saved to {output_path}/digest_{filename}.md")
-
-# Save as DOCX for LinkedIn
-generator.save_articles_to_file(f'{output_path}/digest_{filename}.docx', format='docx')
-logging.info(f"✓ Saved to {output_path}/digest_{filename}.docx (ready for LinkedIn)\n")
+
+@lru_cache(maxsize=1)
+def _get_anthropic_llm() -> ChatAnthropic:
+    """The Opus chat model used for article generation, built on first use."""
+    return ChatAnthropic(
+        model=advanced_llm_name,
+        temperature=0.2,
+        # max_tokens=2048,
+        timeout=None,
+        max_retries=2,
+        api_key=getenv("ANTHROPIC_API_KEY")
+        # model_kwargs={ "http_client": HTTP_CLIENT }
+    )
+
+
+def run():
+    """Generate the articles, executive summary and digest for the configured article profile."""
+    llm = _get_anthropic_llm()
+
+    logging.info(f"Using LLM model: {llm.model}")
+    USAGE_TRACKER_INSTANCE.initialize(model=str(llm.model))
+
+    logging.info(f"{str(article_profile['role'])} ...")
+    filename = article_profile['filename'] + '-' + 'opus'
+    output_path = article_profile['output_path']
+    output_path.mkdir(parents=True, exist_ok=True)
+    digest_opportunities_focus=article_profile['digest_opportunities_focus']
+    md_path = output_path / f'{filename}.md'
+    docx_path = output_path / f'{filename}.docx'
+    digest_md_path = output_path / f'digest_{filename}.md'
+    digest_docx_path = output_path / f'digest_{filename}.docx'
+
+    generator = ArticleGenerator(llm_model=llm)
+    generator.initialize(
+        documents=article_profile['documents'],
+        role=article_profile['role'],
+        article_style=article_profile['article_style'],
+        target_audience=article_profile['target_audience'],
+        article_length=article_profile['article_length'],
+        focus_areas=article_profile['focus_areas'],
+        consolidate_docs=article_profile['consolidate_docs']
+    )
+
+    # Get and save articles
+    articles = generator.get_articles(row_marshal_batch_size=article_profile.get('row_marshal_batch_size', 1))
+    logging.info(f"✓ Generated {len(articles)} article(s)\n")
+
+    #get executive summary email
+    email_summary = ArticleInsightsGenerator().get_key_insights(
+        articles=articles, summary_length=150, max_takeaways=7)
+
+    output_path_txt = output_path / f'{filename}.txt'
+    output_path_txt.write_text(email_summary, encoding='utf-8')
+
+    logging.info(f"✓ Executive summary email saved to {output_path_txt}\n")
+
+    # Save articles (Markdown + DOCX for LinkedIn) and digest files on worker threads.
+    # save_articles_to_file only reads the generated articles, so the writes can overlap
+    # each other and the digest LLM call.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        save_jobs = {
+            md_path: executor.submit(
+                generator.save_articles_to_file, md_path, format='markdown'),
+            docx_path: executor.submit(
+                generator.save_articles_to_file, docx_path, format='docx'),
+        }
+
+        # Generate digest, streaming it into its Markdown file as it arrives
+        logging.info(f"Generating digest focused on {digest_opportunities_focus} ...")
+        with open(digest_md_path, 'w', encoding='utf-8') as f:
+            generator.get_digest(digest_focus=digest_opportunities_focus, sink=f)
+        logging.info(f"✓ Digest saved to {digest_md_path}")
+
+        save_jobs[digest_docx_path] = executor.submit(
+            generator.save_articles_to_file, digest_docx_path, format='docx')
+
+        for saved_path, job in save_jobs.items():
+            job.result()
+            logging.info(f"✓ Saved to {saved_path}\n")
+
 
 def interactive_chat():
     """Example: Using the integrated interactive chat interface for Q&A with history."""
@@ -92,3 +110,7 @@ def interactive_chat():
     
     # Start in article mode
     start_interactive_chat(mode="article")
+
+
+if __name__ == "__main__":
+    run()
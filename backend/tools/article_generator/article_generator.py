@@ -4,10 +4,16 @@ This module provides a flexible article generation system that can assume differ
 to analyze and create articles from various document types (news, scientific papers, financial reports, etc.).
 """
 
+import asyncio
 import logging
 import hashlib
 import json
-from typing import List, Dict, Union, Literal
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from io import BytesIO
+from typing import Iterator, List, Dict, TextIO, Union, Literal
 from pathlib import Path
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
@@ -15,19 +21,90 @@ from langchain_core.documents import Document
 from tools.article_generator.article_prompts import (
     ArticleRole,
     get_role_context,
-    generate_article_prompt,
+    article_prompt_parts,
     generate_digest_prompt,
     generate_qa_prompt
 )
 from tools.rag import AIChatClass
+from doc_loader.doc_importer import ChunkingStrategy
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode, tools_condition
 
 from tools.rag.base_workflow import BaseWorkFlow, RAGState
+from anthropic.types import Message
+from models.anthropic._client import get_client
 from models.anthropic.token_counter import count_tokens_anthropic
 from models.anthropic.usage_tracker import USAGE_TRACKER_INSTANCE as tracker
 
 
+def _run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+    When this thread already runs an event loop (e.g. a notebook or an async caller),
+    asyncio.run would fail, so the coroutine runs on its own loop in a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+@cache
+def _docx_template_bytes() -> bytes:
+    """Serialized blank DOCX with the LinkedIn article styles (Arial 11pt body) applied, built once."""
+    from docx import Document
+    from docx.shared import Pt
+    
+    template = Document()
+    
+    # Set default font
+    font = template.styles['Normal'].font
+    font.name = 'Arial'
+    font.size = Pt(11)
+    
+    # Space body paragraphs through the style instead of empty spacer paragraphs;
+    # bullet lists stay tight
+    template.styles['Normal'].paragraph_format.space_after = Pt(12)
+    template.styles['List Bullet'].paragraph_format.space_after = Pt(0)
+    
+    buffer = BytesIO()
+    template.save(buffer)
+    return buffer.getvalue()
+
+
+def _chunk_text(content) -> str:
+    """Text of a streamed message chunk, whose content is a string or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+# Shortest repeated text treated as splitter overlap; shorter matches are likely coincidental
+_MIN_OVERLAP = 20
+
+
+def _trim_overlap(previous: str, chunk: str, max_overlap: int) -> str:
+    """
+    The chunk without the leading text it repeats from the end of the previous chunk of the same
+    source (the text splitter's chunk_overlap). Returns the chunk itself when it repeats nothing.
+    """
+    if max_overlap < _MIN_OVERLAP or len(chunk) < _MIN_OVERLAP:
+        return chunk
+    
+    tail = previous[-max_overlap:]
+    probe = chunk[:_MIN_OVERLAP]
+    # Earliest match first: the longest overlap
+    start = tail.find(probe)
+    while start != -1:
+        if chunk.startswith(tail[start:]):
+            return chunk[len(tail) - start:].lstrip()
+        start = tail.find(probe, start + 1)
+    return chunk
+
+
 class ArticleStructure(BaseModel):
     """Structured output for generated articles."""
     
@@ -54,6 +131,14 @@ class ArticleStructure(BaseModel):
     )
 
 
+class ArticleBatch(BaseModel):
+    """Structured output for several articles generated in one reply."""
+    
+    articles: List[ArticleStructure] = Field(
+        description="One article per source document, in the order the documents were given"
+    )
+
+
 class ArticleGenerator(BaseWorkFlow):
     """Generates professional articles from documents using configurable expert roles.
     
@@ -77,6 +162,19 @@ class ArticleGenerator(BaseWorkFlow):
         digest = generator.get_digest()
     """
     
+    # Upper bound on article generations in flight at once (provider rate limits)
+    MAX_CONCURRENT_ARTICLES = 8
+    # Consolidations estimated above this many tokens are condensed per source first (map-reduce)
+    CONSOLIDATE_MAX_TOKENS = 150_000
+    # Polling of Anthropic message batches: first wait and cap, in seconds
+    BATCH_POLL_INITIAL_SECONDS = 5
+    BATCH_POLL_MAX_SECONDS = 60
+    BATCH_MAX_TOKENS = 8192
+    # Q&A retrieval searches chunks of this size and answers from the loaded chunks they belong to
+    RETRIEVAL_CHILD_CHUNK_SIZE = 400
+    # Buffer size for the Markdown/JSON article files, so streamed writes reach the disk in large blocks
+    WRITE_BUFFER_SIZE = 1 << 20
+    
     def __init__(self, llm_model: AIChatClass = None, cache_dir: Union[str, Path] = None):
         """
         Initialize the article generator workflow.
@@ -88,11 +186,15 @@ class ArticleGenerator(BaseWorkFlow):
         super().__init__(llm_model)
         self._articles: List[Dict] = []
         self._role: ArticleRole = ArticleRole.JOURNALIST
+        # Role value and display title, derived from self._role once per initialize()
+        self._role_value: str = self._role.value
+        self._role_title: str = self._role_value.replace('_', ' ').title()
         self._role_context: str = ""
         self._article_style: str = "formal"
         self._target_audience: str = "general audience"
         self._article_length: str = "medium"
         self._focus_areas: str = None
+        self._article_prompt_parts: tuple[str, str] = ("", "")
         self._custom_role_description: str = None
         self._consolidate_docs: bool = False
         self._cache_dir: Path = Path(cache_dir) if cache_dir else Path(".article_cache")
@@ -100,6 +202,12 @@ class ArticleGenerator(BaseWorkFlow):
         self._cache_expiry_days: int = 365
         self._cache_key: str = None
         self._total_tokens_used: int = 0
+        self._use_batch_api: bool = False
+        self._docs_by_source: Dict[str, Document] = {}
+        # format -> (articles list it was rendered from, rendered output)
+        self._rendered: Dict[str, tuple] = {}
+        # schema -> with_structured_output runnable, bound on first use
+        self._structured_llms: Dict[type, object] = {}
     
     def initialize(self,
                    documents: Union[List[str], List[Path]],
@@ -111,11 +219,13 @@ class ArticleGenerator(BaseWorkFlow):
                    focus_areas: str = None,
                    chunk_size: int = 2000,
                    chunk_overlap: int = 200,
+                   chunking_strategy: ChunkingStrategy = "recursive",
                    name: str = "ArticleRetriever",
                    description: str = "Retrieves relevant document content for article generation",
                    consolidate_docs: bool = False,
                    use_cache: bool = True,
-                   cache_expiry_days: int = 30):
+                   cache_expiry_days: int = 30,
+                   use_batch_api: bool = False):
         """
         Initialize the article generator with documents and role configuration.
         
@@ -129,42 +239,50 @@ class ArticleGenerator(BaseWorkFlow):
             focus_areas: Optional specific areas to focus on in articles
             chunk_size: Size of document chunks
             chunk_overlap: Overlap between chunks
+            chunking_strategy: "recursive" splits at headings, paragraphs and sentence ends before
+                falling back to words; "fixed" keeps the plain size-based splitting
             name: Name for the retriever
             description: Description of the retriever
             consolidate_docs: Whether to consolidate documents before processing
             use_cache: Whether to use persistent caching for generated articles
             cache_expiry_days: Number of days before cache expires (default: 30)
+            use_batch_api: Submit per-document articles through the Anthropic Message Batches API
+                (half price, but results may take minutes to hours). Anthropic models only
             
         Raises:
             ValueError: If role is CUSTOM but no custom_role_description provided
         """
+        # Validate the role before any state changes or document loading, so a bad call fails fast
+        role, custom_role_description, role_context = self._resolve_role(role, custom_role_description)
+        
+        self._role = role
+        self._role_value = self._role.value
+        self._role_title = self._role_value.replace('_', ' ').title()
+        self._role_context = role_context
+        
+        # Store configuration
+        self._custom_role_description = custom_role_description
+        self._article_style = article_style
+        self._target_audience = target_audience
+        self._article_length = article_length
+        self._focus_areas = focus_areas
+        self._consolidate_docs = consolidate_docs
+        self._cache_enabled = use_cache
+        self._cache_expiry_days = cache_expiry_days
+        self._use_batch_api = use_batch_api
+        self._total_tokens_used = 0
+        self._rendered.clear()
+        
+        # Everything in the article prompt but the document, rendered once for all documents
+        self._article_prompt_parts = article_prompt_parts(
+            role_context=self._role_context,
+            article_style=self._article_style,
+            target_audience=self._target_audience,
+            article_length=self._article_length,
+            focus_areas=self._focus_areas
+        )
+        
         try:
-            # Convert string role to ArticleRole enum if needed
-            if isinstance(role, str):
-                try:
-                    self._role = ArticleRole(role.lower())
-                except ValueError:
-                    # If not a valid enum value, treat as custom
-                    self._role = ArticleRole.CUSTOM
-                    if not custom_role_description:
-                        custom_role_description = f"You are a professional {role}."
-            else:
-                self._role = role
-            
-            # Store configuration
-            self._custom_role_description = custom_role_description
-            self._article_style = article_style
-            self._target_audience = target_audience
-            self._article_length = article_length
-            self._focus_areas = focus_areas
-            self._consolidate_docs = consolidate_docs
-            self._cache_enabled = use_cache
-            self._cache_expiry_days = cache_expiry_days
-            self._total_tokens_used = 0
-            
-            # Get role context
-            self._role_context = get_role_context(self._role, custom_role_description)
-            
             logging.info(f"Initializing ArticleGenerator with role: {self._role}")
             logging.info(f"Role context: {self._role_context[:100]}...")
             
@@ -173,13 +291,16 @@ class ArticleGenerator(BaseWorkFlow):
                 data_sources=documents,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
-                use_cache=True
+                use_cache=True,
+                chunking_strategy=chunking_strategy
             )
+            self._docs_by_source = self._group_chunks_by_source(self._documents, chunk_overlap)
             
             # Setup retriever and tools
             self._setup_retriever_and_tools(
                 name=name,
-                description=description
+                description=description,
+                child_chunk_size=self.RETRIEVAL_CHILD_CHUNK_SIZE
             )
             
             # Generate cache key based on configuration and documents
@@ -198,6 +319,152 @@ class ArticleGenerator(BaseWorkFlow):
             logging.error(f"Error initializing article generator: {e}")
             raise
     
+    @staticmethod
+    def _resolve_role(role: Union[ArticleRole, str], custom_role_description: str = None) -> tuple[ArticleRole, str, str]:
+        """
+        Normalize the role argument of initialize() without side effects.
+        
+        Returns:
+            (role, custom role description, role context)
+            
+        Raises:
+            ValueError: If role is CUSTOM but no custom_role_description provided
+        """
+        # Convert string role to ArticleRole enum if needed
+        if isinstance(role, str):
+            try:
+                role = ArticleRole(role.lower())
+            except ValueError:
+                # If not a valid enum value, treat as custom
+                if not custom_role_description:
+                    custom_role_description = f"You are a professional {role}."
+                role = ArticleRole.CUSTOM
+        
+        return role, custom_role_description, get_role_context(role, custom_role_description)
+    
+    @staticmethod
+    def _group_chunks_by_source(chunks: List[Document], chunk_overlap: int = 0) -> Dict[str, Document]:
+        """
+        Reassemble loaded chunks into one Document per source, in load order.
+        Consecutive chunks repeat up to chunk_overlap characters of their predecessor; that repeated
+        text is dropped, so every passage appears once in the article prompts.
+        """
+        parts_by_source: Dict[str, List[str]] = {}
+        metadata_by_source: Dict[str, Dict] = {}
+        previous_by_source: Dict[str, str] = {}
+        for chunk in chunks or []:
+            source = chunk.metadata.get('source', '')
+            content = chunk.page_content
+            if source not in parts_by_source:
+                parts_by_source[source] = [content]
+                metadata_by_source[source] = chunk.metadata
+            else:
+                remainder = _trim_overlap(previous_by_source[source], content, chunk_overlap)
+                if remainder is content:
+                    parts_by_source[source].append("\n\n")
+                    parts_by_source[source].append(content)
+                elif remainder:
+                    # The chunk continues its predecessor's text
+                    parts_by_source[source].append(" ")
+                    parts_by_source[source].append(remainder)
+            previous_by_source[source] = content
+        
+        return {
+            source: Document(page_content="".join(parts), metadata=metadata_by_source[source])
+            for source, parts in parts_by_source.items()
+        }
+    
+    def _build_article_prompt(self, document: Document) -> str:
+        """Create the article-generation prompt for a document."""
+        prefix, suffix = self._article_prompt_parts
+        return f"{prefix}{document.page_content}{suffix}"
+    
+    def _article_from_response(self, document: Document, prompt: str, response: ArticleStructure) -> Dict[str, any]:
+        """Count and track the tokens of a completed generation and build the article dictionary."""
+        # Count input tokens
+        input_tokens = count_tokens_anthropic(
+            messages=[{"role": "user", "content": prompt}],
+            system=""
+        )
+
+        tracker.track_input(messages=[{"role": "user", "content": prompt}], tools=[])
+        self._total_tokens_used += input_tokens
+        logging.info(f"Total tokens used: {self._total_tokens_used}")
+        
+        # Count output tokens by converting structured response to text
+        # Combine all response fields into a single content string
+        output_content = f"""Title: {response.title}
+Introduction: {response.introduction}
+Main Sections: {json.dumps(response.main_sections)}
+Conclusion: {response.conclusion}
+Key Insights: {json.dumps(response.key_insights)}
+Tags: {response.tags}"""
+        
+        output_tokens = count_tokens_anthropic(
+            messages=[{"role": "assistant", "content": output_content}],
+            system=""
+        )
+
+        self._total_tokens_used += output_tokens
+        logging.info(f"Total tokens: {self._total_tokens_used}")
+        tracker.track_output(output_content)
+        
+        return {
+            "title": response.title,
+            "introduction": response.introduction,
+            "main_sections": response.main_sections,
+            "conclusion": response.conclusion,
+            "key_insights": response.key_insights,
+            "tags": response.tags,
+            "metadata": {
+                "source": document.metadata.get('source', ''),
+                "role": self._role_value,
+                "style": self._article_style,
+                "audience": self._target_audience,
+                "original_length": len(document.page_content),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens
+            }
+        }
+    
+    @staticmethod
+    def _article_error(document: Document, e: Exception) -> Dict[str, any]:
+        """Placeholder article returned when generation fails."""
+        logging.error(f"Error generating article: {e}")
+        return {
+            "title": f"Error: {document.metadata.get('title', 'Untitled')}",
+            "introduction": f"Error generating article: {str(e)}",
+            "main_sections": [],
+            "conclusion": "",
+            "key_insights": [],
+            "tags": "",
+            "metadata": {
+                "source": document.metadata.get('source', ''),
+                "error": str(e)
+            }
+        }
+    
+    def _build_grouped_article_prompt(self, documents: List[Document]) -> str:
+        """Create one prompt asking for a separate article for each of several documents."""
+        marshalled = "\n".join(
+            f'<doc idx="{idx}">\n{doc.page_content}\n</doc>' for idx, doc in enumerate(documents)
+        )
+        prefix, suffix = self._article_prompt_parts
+        return (
+            f"{prefix}{marshalled}{suffix}\n\nThe source contains {len(documents)} separate documents, each wrapped in a <doc> element. "
+            f"Write one independent article per document and return exactly {len(documents)} articles, "
+            f"in the same order as the documents."
+        )
+    
+    def _structured_llm(self, schema: type):
+        """The LLM bound to return `schema`, built once per schema and reused across calls."""
+        structured_llm = self._structured_llms.get(schema)
+        if structured_llm is None:
+            structured_llm = self._llm_model.with_structured_output(schema)
+            self._structured_llms[schema] = structured_llm
+        return structured_llm
+    
     def _generate_article_from_document(self, document: Document) -> Dict[str, any]:
         """
         Generate a professional article from a single document.
@@ -209,81 +476,149 @@ class ArticleGenerator(BaseWorkFlow):
             Dictionary with article structure and metadata (including token counts)
         """
         try:
-            # Create the prompt
-            prompt = generate_article_prompt(
-                role_context=self._role_context,
-                document_content=document.page_content,
-                article_style=self._article_style,
-                target_audience=self._target_audience,
-                article_length=self._article_length,
-                focus_areas=self._focus_areas
-            )
-            
-            # Count input tokens
-            input_tokens = count_tokens_anthropic(
-                messages=[{"role": "user", "content": prompt}],
-                system=""
-            )
-
-            tracker.track_input(messages=[{"role": "user", "content": prompt}], tools=[])
-            self._total_tokens_used += input_tokens
-            logging.info(f"Total tokens used: {self._total_tokens_used}")
+            prompt = self._build_article_prompt(document)
             
             # Use structured output
-            structured_llm = self._llm_model.with_structured_output(ArticleStructure)
+            structured_llm = self._structured_llm(ArticleStructure)
             response: ArticleStructure = structured_llm.invoke([{"role": "user", "content": prompt}])
             
-            # Count output tokens by converting structured response to text
-            # Combine all response fields into a single content string
-            output_content = f"""Title: {response.title}
-Introduction: {response.introduction}
-Main Sections: {json.dumps(response.main_sections)}
-Conclusion: {response.conclusion}
-Key Insights: {json.dumps(response.key_insights)}
-Tags: {response.tags}"""
+            return self._article_from_response(document, prompt, response)
             
-            output_tokens = count_tokens_anthropic(
-                messages=[{"role": "assistant", "content": output_content}],
-                system=""
-            )
-
-            self._total_tokens_used += output_tokens
-            logging.info(f"Total tokens: {self._total_tokens_used}")
-            tracker.track_output(output_content)
-            
-            return {
-                "title": response.title,
-                "introduction": response.introduction,
-                "main_sections": response.main_sections,
-                "conclusion": response.conclusion,
-                "key_insights": response.key_insights,
-                "tags": response.tags,
-                "metadata": {
-                    "source": document.metadata.get('source', ''),
-                    "role": self._role.value,
-                    "style": self._article_style,
-                    "audience": self._target_audience,
-                    "original_length": len(document.page_content),
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": input_tokens + output_tokens
-                }
-            }
+        except Exception as e:
+            return self._article_error(document, e)
+    
+    async def _agenerate_article_from_document(self, document: Document, semaphore: asyncio.Semaphore) -> Dict[str, any]:
+        """Async variant of _generate_article_from_document; the semaphore caps in-flight LLM calls."""
+        try:
+            prompt = self._build_article_prompt(document)
+            structured_llm = self._structured_llm(ArticleStructure)
+            
+            async with semaphore:
+                response: ArticleStructure = await structured_llm.ainvoke([{"role": "user", "content": prompt}])
+            
+            return self._article_from_response(document, prompt, response)
             
         except Exception as e:
-            logging.error(f"Error generating article: {e}")
-            return {
-                "title": f"Error: {document.metadata.get('title', 'Untitled')}",
-                "introduction": f"Error generating article: {str(e)}",
-                "main_sections": [],
-                "conclusion": "",
-                "key_insights": [],
-                "tags": "",
-                "metadata": {
-                    "source": document.metadata.get('source', ''),
-                    "error": str(e)
-                }
+            return self._article_error(document, e)
+    
+    async def _agenerate_article_group(self, documents: List[Document], semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Generate the articles of several documents with a single LLM call (row marshaling)."""
+        if len(documents) == 1:
+            return [await self._agenerate_article_from_document(documents[0], semaphore)]
+        
+        try:
+            prompt = self._build_grouped_article_prompt(documents)
+            structured_llm = self._structured_llm(ArticleBatch)
+            
+            async with semaphore:
+                response: ArticleBatch = await structured_llm.ainvoke([{"role": "user", "content": prompt}])
+            
+            if len(response.articles) != len(documents):
+                raise ValueError(f"Expected {len(documents)} articles, received {len(response.articles)}")
+            
+        except Exception as e:
+            logging.warning(f"Grouped article generation failed, generating one article per document: {e}")
+            return list(await asyncio.gather(
+                *(self._agenerate_article_from_document(doc, semaphore) for doc in documents)
+            ))
+        
+        # The shared prompt's tokens are attributed to the first article of the group
+        return [
+            self._article_from_response(doc, prompt if idx == 0 else "", article)
+            for idx, (doc, article) in enumerate(zip(documents, response.articles))
+        ]
+    
+    async def _agenerate_articles(self, documents: List[Document], group_size: int = 1) -> List[Dict]:
+        """Generate articles for all documents concurrently, preserving document order."""
+        group_size = max(1, group_size)
+        if group_size == 1:
+            # One request per document: a single abatch over one structured-output runnable
+            prompts = [self._build_article_prompt(doc) for doc in documents]
+            structured_llm = self._structured_llm(ArticleStructure)
+            responses = await structured_llm.abatch(
+                [[{"role": "user", "content": prompt}] for prompt in prompts],
+                config={"max_concurrency": self.MAX_CONCURRENT_ARTICLES},
+                return_exceptions=True
+            )
+            return [
+                self._article_error(doc, response) if isinstance(response, Exception)
+                else self._article_from_response(doc, prompt, response)
+                for doc, prompt, response in zip(documents, prompts, responses)
+            ]
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ARTICLES)
+        groups = [documents[i:i + group_size] for i in range(0, len(documents), group_size)]
+        results = await asyncio.gather(
+            *(self._agenerate_article_group(group, semaphore) for group in groups)
+        )
+        return [article for group_articles in results for article in group_articles]
+    
+    def _submit_batch(self, requests: List[Dict]) -> List[Union[Message, None]]:
+        """
+        Submit message requests as one Anthropic message batch and wait for the results.
+        
+        Args:
+            requests: messages.create parameters, one dict per request
+            
+        Returns:
+            The response Message of each request in input order (None where a request failed)
+        """
+        client = get_client()
+        batch = client.messages.batches.create(requests=[
+            {"custom_id": str(i), "params": params} for i, params in enumerate(requests)
+        ])
+        logging.info(f"Submitted message batch {batch.id} with {len(requests)} requests.")
+        
+        # Poll with exponential backoff until the batch has ended
+        delay = self.BATCH_POLL_INITIAL_SECONDS
+        while batch.processing_status != "ended":
+            time.sleep(delay)
+            delay = min(delay * 2, self.BATCH_POLL_MAX_SECONDS)
+            batch = client.messages.batches.retrieve(batch.id)
+        
+        messages: List[Union[Message, None]] = [None] * len(requests)
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                messages[int(entry.custom_id)] = entry.result.message
+            else:
+                logging.error(f"Batch request {entry.custom_id} did not succeed: {entry.result.type}")
+        
+        return messages
+    
+    def _generate_articles_batch(self, documents: List[Document]) -> List[Dict]:
+        """Generate articles for all documents in one Anthropic message batch."""
+        # Structured output the way ChatAnthropic does it: a single forced tool call
+        article_tool = {
+            "name": ArticleStructure.__name__,
+            "description": ArticleStructure.__doc__,
+            "input_schema": ArticleStructure.model_json_schema()
+        }
+        prompts = [self._build_article_prompt(doc) for doc in documents]
+        max_tokens = getattr(self._llm_model, "max_tokens", None) or self.BATCH_MAX_TOKENS
+        
+        messages = self._submit_batch([
+            {
+                "model": self._llm_model.model,
+                "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}],
+                "tools": [article_tool],
+                "tool_choice": {"type": "tool", "name": article_tool["name"]}
             }
+            for prompt in prompts
+        ])
+        
+        articles = []
+        for document, prompt, message in zip(documents, prompts, messages):
+            try:
+                if message is None:
+                    raise ValueError("Batch request failed")
+                tool_input = next(block.input for block in message.content if block.type == "tool_use")
+                response = ArticleStructure.model_validate(tool_input)
+                articles.append(self._article_from_response(document, prompt, response))
+            except Exception as e:
+                articles.append(self._article_error(document, e))
+        
+        return articles
     
     def _generate_cache_key(self, documents: Union[List[str], List[Path]]) -> str:
         """Generate a unique cache key based on documents and configuration.
@@ -297,7 +632,7 @@ Tags: {response.tags}"""
         # Create a string combining all relevant parameters
         key_components = [
             str(sorted([str(d) for d in documents])),
-            self._role.value,
+            self._role_value,
             str(self._custom_role_description),
             self._article_style,
             self._target_audience,
@@ -365,7 +700,7 @@ Tags: {response.tags}"""
                 'timestamp': datetime.now().isoformat(),
                 'cache_key': self._cache_key,
                 'config': {
-                    'role': self._role.value,
+                    'role': self._role_value,
                     'style': self._article_style,
                     'audience': self._target_audience,
                     'length': self._article_length,
@@ -383,11 +718,104 @@ Tags: {response.tags}"""
         except Exception as e:
             logging.warning(f"Error saving to cache: {e}")
     
+    def _get_document_cache_path(self, document: Document) -> Path:
+        """Get the cache file path of a single document's article.
+        
+        The key hashes the document text with the article configuration and model, so an unchanged
+        document keeps its article across runs, whichever collection or path it is loaded from.
+        
+        Returns:
+            Path to cache file
+        """
+        key_components = [
+            document.page_content,
+            self._role_value,
+            str(self._custom_role_description),
+            self._article_style,
+            self._target_audience,
+            self._article_length,
+            str(self._focus_areas),
+            str(getattr(self._llm_model, "model", None) or getattr(self._llm_model, "model_name", ""))
+        ]
+        key = hashlib.sha256("|".join(key_components).encode()).hexdigest()
+        return self._cache_dir / "documents" / f"{key}.json"
+    
+    def _load_document_article(self, document: Document) -> Union[Dict, None]:
+        """Load a document's article from the document cache if available and not expired.
+        
+        Returns:
+            Cached article dictionary or None if cache miss/expired
+        """
+        cache_path = self._get_document_cache_path(document)
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache_data = json.load(f)
+            
+            cached_time = datetime.fromisoformat(cache_data.get('timestamp', ''))
+            if datetime.now() > cached_time + timedelta(days=self._cache_expiry_days):
+                cache_path.unlink(missing_ok=True)
+                return None
+            
+            return cache_data.get('article')
+            
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Error loading document cache {cache_path}: {e}")
+            return None
+    
+    def _save_document_article(self, document: Document, article: Dict):
+        """Save a document's article to the document cache. Failed generations are not cached.
+        
+        The file is written under a temporary name and then renamed, so a concurrent or interrupted
+        run never reads a partial cache entry.
+        """
+        if article['metadata'].get('error'):
+            return
+        
+        cache_path = self._get_document_cache_path(document)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': datetime.now().isoformat(), 'article': article}, f, ensure_ascii=False)
+            tmp_path.replace(cache_path)
+            
+        except Exception as e:
+            logging.warning(f"Error saving to document cache: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def _with_document_cache(self, documents: List[Document], generate) -> List[Dict]:
+        """
+        Articles for the given documents, in order. Articles cached for unchanged documents are reused
+        and only the remaining documents are passed (in one call) to `generate`.
+        """
+        if not self._cache_enabled:
+            return generate(documents)
+        
+        articles = [self._load_document_article(doc) for doc in documents]
+        missing = [doc for doc, article in zip(documents, articles) if article is None]
+        if len(missing) < len(documents):
+            logging.info(f"Loaded {len(documents) - len(missing)} of {len(documents)} article(s) from the document cache.")
+        if not missing:
+            return articles
+        
+        generated = iter(generate(missing))
+        for idx, doc in enumerate(documents):
+            if articles[idx] is None:
+                articles[idx] = next(generated)
+                self._save_document_article(doc, articles[idx])
+        
+        return articles
+    
     def clear_cache(self, all_caches: bool = False):
         """Clear cached articles.
         
         Args:
-            all_caches: If True, clear all caches. If False, clear only current cache.
+            all_caches: If True, clear all caches. If False, clear only current cache
+                (and the document cache entries of the loaded documents).
         """
         if all_caches:
             if self._cache_dir.exists():
@@ -399,10 +827,51 @@ Tags: {response.tags}"""
             if cache_path.exists():
                 cache_path.unlink()
                 logging.info(f"Cleared cache: {cache_path}.")
+            documents = self._source_documents()
+            if self._consolidate_docs:
+                # Including the per-source articles of a condensed (map-reduce) consolidation
+                documents += self._per_source_documents()
+            for document in documents:
+                self._get_document_cache_path(document).unlink(missing_ok=True)
+    
+    def _source_documents(self) -> List[Document]:
+        """The documents articles are written from: one consolidated document, or one full-text document per source."""
+        if self._consolidate_docs:
+            combined_content = "\n\n".join(doc.page_content for doc in self._docs_by_source.values())
+            return [Document(
+                page_content=combined_content,
+                metadata={"source": "Consolidated Documents"}
+            )]
+        
+        return self._per_source_documents()
+    
+    def _per_source_documents(self) -> List[Document]:
+        """One full-text document per source (chunks without a source are left out)."""
+        return [doc for source, doc in self._docs_by_source.items() if source]
+    
+    def _condensed_consolidated_document(self, row_marshal_batch_size: int = 1) -> Document:
+        """
+        Map step of a consolidation too large for one prompt: write an article per source (concurrently,
+        through the document cache) and consolidate their condensed text instead of the full sources.
+        """
+        documents = self._per_source_documents()
+        logging.info(f"Consolidated sources exceed ~{self.CONSOLIDATE_MAX_TOKENS:,} tokens; "
+                     f"condensing {len(documents)} source(s) into articles first...")
+        articles = self._with_document_cache(
+            documents,
+            lambda docs: _run_coroutine(self._agenerate_articles(docs, group_size=row_marshal_batch_size))
+        )
+        return Document(
+            page_content=self._condensed_articles_text(articles),
+            metadata={"source": "Consolidated Documents"}
+        )
     
-    def _generate_all_articles(self) -> List[Dict]:
+    def _generate_all_articles(self, row_marshal_batch_size: int = 1) -> List[Dict]:
         """Generate articles from all loaded documents.
         
+        Args:
+            row_marshal_batch_size: Number of documents to pack into each LLM call
+        
         Returns:
             List of article dictionaries
         """
@@ -415,15 +884,18 @@ Tags: {response.tags}"""
         if self._consolidate_docs:
             
             logging.info("Consolidating documents before article generation...")
-            combined_content = "\n\n".join(doc.page_content for doc in self._documents)
-            consolidated_doc = Document(
-                page_content=combined_content,
-                metadata={"source": "Consolidated Documents"}
-            )
-
+            # Rough size estimate (~4 characters per token) without building the combined text
+            estimated_tokens = sum(len(doc.page_content) for doc in self._docs_by_source.values()) // 4
+            if estimated_tokens > self.CONSOLIDATE_MAX_TOKENS:
+                documents = [self._condensed_consolidated_document(row_marshal_batch_size)]
+            else:
+                documents = self._source_documents()
+            
             logging.info("Generating consolidated article...")
-            article = self._generate_article_from_document(consolidated_doc)
-            articles.append(article)
+            articles = self._with_document_cache(
+                documents,
+                lambda docs: [self._generate_article_from_document(doc) for doc in docs]
+            )
             
             # Cache the generated articles
             if articles and self._cache_enabled:
@@ -431,17 +903,16 @@ Tags: {response.tags}"""
             
             return articles
         
-        # Group documents by source to avoid duplicates
-        docs_by_source = {}
-        for doc in self._documents:
-            source = doc.metadata.get('source', '')
-            if source and source not in docs_by_source:
-                docs_by_source[source] = doc
+        documents = self._source_documents()
         
-        for i, (source, doc) in enumerate(docs_by_source.items(), 1):
-            logging.info(f"Generating article {i}/{len(docs_by_source)} from: {source[:80]}...")
-            article = self._generate_article_from_document(doc)
-            articles.append(article)
+        def generate(documents: List[Document]) -> List[Dict]:
+            if self._use_batch_api and len(documents) > 1 and str(getattr(self._llm_model, "model", "")).startswith("claude"):
+                logging.info(f"Generating {len(documents)} articles through a message batch...")
+                return self._generate_articles_batch(documents)
+            logging.info(f"Generating {len(documents)} articles concurrently...")
+            return _run_coroutine(self._agenerate_articles(documents, group_size=row_marshal_batch_size))
+        
+        articles = self._with_document_cache(documents, generate)
         
         # Cache the generated articles
         if articles and self._cache_enabled:
@@ -449,16 +920,23 @@ Tags: {response.tags}"""
         
         return articles
     
-    def generate_digest(self, articles: List[Dict] = None, digest_focus: str = "key themes and insights") -> str:
+    def generate_digest(
+        self,
+        articles: List[Dict] = None,
+        digest_focus: str = "key themes and insights",
+        sink: TextIO = None
+    ) -> str:
         """
         Generate a comprehensive digest from multiple articles.
         
         Args:
             articles: Optional list of article dictionaries. If not provided, uses self._articles
             digest_focus: What to focus on in the digest
+            sink: Optional text stream (e.g. an open file). When given, the digest is streamed from
+                the LLM and written chunk by chunk instead of being buffered and returned
             
         Returns:
-            A comprehensive digest in Markdown format
+            A comprehensive digest in Markdown format (empty when streamed to sink)
         """
         if not articles:
             articles = self._articles
@@ -466,41 +944,60 @@ Tags: {response.tags}"""
         if not articles:
             return "No articles to create digest from."
         
-        # Prepare articles summary
-        articles_text = []
-        for i, article in enumerate(articles, 1):
-            try:
-                sections_summary = "\n".join([
-                    f"  - {section.get('heading', 'Section')}: {section.get('content', '')[:200]}..."
-                    for section in article.get('main_sections', [])[:3]
-                ])
-                
-                articles_text.append(f"""Article {i}: {article['title']}
-Source: {article['metadata'].get('source', 'N/A')}
-Tags: {article['tags']}
-Introduction: {article['introduction'][:300]}...
-Key Insights: {chr(10).join(['- ' + insight for insight in article['key_insights']])}
-Main Sections:
-{sections_summary}""")
-            except Exception as e:
-                logging.error(f"Error preparing article {i} for digest: {e}")
-                continue
-        
-        combined_text = '\n---\n'.join(articles_text)
+        prompt = generate_digest_prompt(
+            role_context=self._role_context,
+            articles_summary=self._condensed_articles_text(articles),
+            digest_focus=digest_focus
+        )
         
         try:
-            prompt = generate_digest_prompt(
-                role_context=self._role_context,
-                articles_summary=combined_text,
-                digest_focus=digest_focus
-            )
-            response = self._llm_model.invoke([{"role": "user", "content": prompt}])
-            return response.content
+            if sink is None:
+                response = self._llm_model.invoke([{"role": "user", "content": prompt}])
+                return response.content
+            
+            for chunk in self._llm_model.stream([{"role": "user", "content": prompt}]):
+                sink.write(_chunk_text(chunk.content))
+            return ""
         
         except Exception as e:
             logging.error(f"Error generating digest: {e}")
+            if sink is not None:
+                sink.write(f"Error generating digest: {str(e)}")
+                return ""
             return f"Error generating digest: {str(e)}"
     
+    def _condensed_articles_text(self, articles: List[Dict]) -> str:
+        """Condensed text of several articles (see _digest_entry), separated by horizontal rules."""
+        # Placeholder articles of failed generations have no sections and nothing worth digesting
+        entries = (
+            self._digest_entry(i, article)
+            for i, article in enumerate(articles, 1)
+            if article.get('main_sections')
+        )
+        return '\n---\n'.join(entry for entry in entries if entry is not None)
+    
+    @staticmethod
+    def _digest_entry(index: int, article: Dict) -> Union[str, None]:
+        """Condensed text of one article for the digest prompt, or None when the article is malformed."""
+        try:
+            sections_summary = "\n".join(
+                f"  - {section.get('heading', 'Section')}: {section.get('content', '')[:200]}..."
+                for section in article['main_sections'][:3]
+            )
+            key_insights = "\n".join(f"- {insight}" for insight in article['key_insights'])
+            return (
+                f"Article {index}: {article['title']}\n"
+                f"Source: {article['metadata'].get('source', 'N/A')}\n"
+                f"Tags: {article['tags']}\n"
+                f"Introduction: {article['introduction'][:300]}...\n"
+                f"Key Insights: {key_insights}\n"
+                f"Main Sections:\n"
+                f"{sections_summary}"
+            )
+        except Exception as e:
+            logging.error(f"Error preparing article {index} for digest: {e}")
+            return None
+    
     def format_article_as_markdown(self, article: Dict) -> str:
         """
         Format an article dictionary as readable Markdown.
@@ -511,33 +1008,38 @@ Main Sections:
         Returns:
             Markdown-formatted article string
         """
-        md = f"# {article['title']}\n\n"
-        md += f"**Tags:** {article['tags']}\n\n"
-        md += f"---\n\n"
-        md += f"{article['introduction']}\n\n"
+        metadata = article['metadata']
+        parts = [
+            f"# {article['title']}\n\n",
+            f"**Tags:** {article['tags']}\n\n",
+            "---\n\n",
+            f"{article['introduction']}\n\n",
+        ]
         
         for section in article.get('main_sections', []):
-            md += f"## {section.get('heading', 'Section')}\n\n"
-            md += f"{section.get('content', '')}\n\n"
+            parts.append(f"## {section.get('heading', 'Section')}\n\n")
+            parts.append(f"{section.get('content', '')}\n\n")
         
-        md += f"## Conclusion\n\n"
-        md += f"{article['conclusion']}\n\n"
+        parts.append("## Conclusion\n\n")
+        parts.append(f"{article['conclusion']}\n\n")
         
-        md += f"### Key Insights\n\n"
-        for insight in article.get('key_insights', []):
-            md += f"- {insight}\n"
+        parts.append("### Key Insights\n\n")
+        parts.extend(f"- {insight}\n" for insight in article.get('key_insights', []))
         
-        md += f"\n---\n\n"
-        md += f"*Source: {article['metadata'].get('source', 'N/A')}*\n"
-        md += f"*Role: {article['metadata'].get('role', 'N/A')} | Style: {article['metadata'].get('style', 'N/A')} | Audience: {article['metadata'].get('audience', 'N/A')}*\n"
+        parts.append("\n---\n\n")
+        parts.append(f"*Source: {metadata.get('source', 'N/A')}*\n")
+        parts.append(f"*Role: {metadata.get('role', 'N/A')} | Style: {metadata.get('style', 'N/A')} | Audience: {metadata.get('audience', 'N/A')}*\n")
         
-        return md
+        return "".join(parts)
     
-    def get_articles(self, force_regenerate: bool = False) -> List[Dict]:
+    def get_articles(self, force_regenerate: bool = False, row_marshal_batch_size: int = 1) -> List[Dict]:
         """Get all generated articles.
         
         Args:
             force_regenerate: If True, ignore cache and regenerate articles
+            row_marshal_batch_size: Number of (non-consolidated) documents written up per LLM call.
+                Values of 2-4 cut the number of requests when documents are short relative to the
+                context window; 1 keeps one call per document
         
         Returns:
             List of article dictionaries
@@ -548,27 +1050,85 @@ Main Sections:
             self._articles = []
         
         if not self._articles:
-           self._articles = self._generate_all_articles()
+           self._articles = self._generate_all_articles(row_marshal_batch_size=row_marshal_batch_size)
            if not self._articles:
                 raise ValueError("No articles available. Call initialize() first.")
         
         return self._articles
     
-    def get_digest(self, digest_focus: str = "key themes and insights") -> str:
+    def iter_articles(self) -> Iterator[Dict]:
+        """Yield the articles one at a time, in document order, as they become available.
+        
+        Unlike get_articles, the caller does not wait for the whole collection: all sources are written up
+        concurrently and each article is yielded as soon as it (and the ones before it) is done, so the first
+        articles can be processed while later ones are still generating. Articles already generated or cached
+        are yielded right away. Once the iterator is exhausted, the articles are kept and cached as by
+        get_articles(). Consolidated generation produces a single article and is delegated to get_articles().
+        
+        Yields:
+            Article dictionaries
+        """
+        if self._articles or self._consolidate_docs:
+            yield from self.get_articles()
+            return
+        
+        documents = self._source_documents()
+        if not documents:
+            raise ValueError("No articles available. Call initialize() first.")
+        
+        structured_llm = self._structured_llm(ArticleStructure)
+        cached = [self._load_document_article(doc) if self._cache_enabled else None for doc in documents]
+        articles = []
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_ARTICLES) as executor:
+            # Only the LLM calls run on worker threads; token tracking stays on the consuming thread
+            pending = []
+            for doc, article in zip(documents, cached):
+                if article is not None:
+                    pending.append(None)
+                    continue
+                prompt = self._build_article_prompt(doc)
+                pending.append((prompt, executor.submit(structured_llm.invoke, [{"role": "user", "content": prompt}])))
+            
+            try:
+                for doc, article, job in zip(documents, cached, pending):
+                    if job is not None:
+                        prompt, future = job
+                        try:
+                            article = self._article_from_response(doc, prompt, future.result())
+                        except Exception as e:
+                            article = self._article_error(doc, e)
+                        if self._cache_enabled:
+                            self._save_document_article(doc, article)
+                    
+                    articles.append(article)
+                    yield article
+            
+            except GeneratorExit:
+                # The caller stopped early: drop the generations that have not started
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        self._articles = articles
+        if self._cache_enabled:
+            self._save_to_cache(articles)
+    
+    def get_digest(self, digest_focus: str = "key themes and insights", sink: TextIO = None) -> str:
         """Generate and return a comprehensive digest.
         
         Args:
             digest_focus: What to focus on in the digest
+            sink: Optional text stream to write the digest to as it is generated
             
         Returns:
-            Formatted digest string
+            Formatted digest string (empty when streamed to sink)
         """
         if not self._articles:
            self._generate_all_articles()
            if not self._articles:
                 raise ValueError("No articles available. Call initialize() first.")
         
-        return self.generate_digest(self._articles, digest_focus)
+        return self.generate_digest(self._articles, digest_focus, sink=sink)
     
     def save_articles_to_file(self, output_path: Union[str, Path], format: Literal["markdown", "json", "docx"] = "markdown"):
         """
@@ -583,63 +1143,88 @@ Main Sections:
         output_path = Path(output_path)
         
         if format == "markdown":
-            content = f"# Generated Articles\n\n"
-            content += f"**Role:** {self._role.value}\n"
-            content += f"**Total Articles:** {len(self._articles)}\n\n"
-            content += "---\n\n"
-            
-            for i, article in enumerate(self._articles, 1):
-                content += f"\n\n<!-- Article {i} -->\n\n"
-                content += self.format_article_as_markdown(article)
-                content += "\n\n---\n\n"
-            
-            output_path.write_text(content, encoding='utf-8')
+            # Written article by article so the whole document is never held in memory at once
+            with output_path.open('w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._iter_markdown())
         
         elif format == "json":
-            output_path.write_text(
-                json.dumps(self._articles, indent=2, ensure_ascii=False),
-                encoding='utf-8'
-            )
+            with output_path.open('w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f:
+                json.dump(self._articles, f, indent=2, ensure_ascii=False)
         
         elif format == "docx":
             self._save_articles_as_docx(output_path)
         
         logging.info(f"Articles saved to {output_path}")
     
+    def _rendered_output(self, format: str, render):
+        """
+        Return the articles rendered in the given format, rendering only when the articles changed
+        since the last call (e.g. the article and digest DOCX files of one run share a rendering).
+        """
+        rendered = self._rendered.get(format)
+        if rendered is None or rendered[0] is not self._articles:
+            rendered = (self._articles, render())
+            self._rendered[format] = rendered
+        return rendered[1]
+    
+    def _iter_markdown(self) -> Iterator[str]:
+        """Yield the Markdown document of all articles piece by piece, one article at a time."""
+        yield (
+            "# Generated Articles\n\n"
+            f"**Role:** {self._role_value}\n"
+            f"**Total Articles:** {len(self._articles)}\n\n"
+            "---\n\n"
+        )
+        
+        for i, article in enumerate(self._articles, 1):
+            yield f"\n\n<!-- Article {i} -->\n\n"
+            yield self.format_article_as_markdown(article)
+            yield "\n\n---\n\n"
+    
+    def _render_qa_summary(self) -> str:
+        """Render the titles and top insights of the first articles for the Q&A prompt."""
+        return "\n".join(
+            f"- {a['title']}: {', '.join(a['key_insights'][:3])}"
+            for a in self._articles[:5]  # Top 5 articles
+        )
+    
     def _save_articles_as_docx(self, output_path: Path):
+        """Save articles to a Word document formatted for LinkedIn articles (see _render_docx)."""
+        output_path.write_bytes(self._rendered_output("docx", self._render_docx))
+        logging.info(f"DOCX file saved with {len(self._articles)} article(s) ready for LinkedIn")
+    
+    def _render_docx(self) -> bytes:
         """
-        Save articles to a Word document formatted for LinkedIn articles.
+        Render articles as a Word document formatted for LinkedIn articles.
         
         LinkedIn article format:
         - Clean, professional styling
         - Clear headings and sections
         - Easy to copy/paste directly into LinkedIn article editor
         
-        Args:
-            output_path: Path to save the DOCX file
+        Returns:
+            The DOCX file content
         """
         from docx import Document
-        from docx.shared import Pt, RGBColor, Inches
+        from docx.shared import Pt, RGBColor
         from docx.enum.text import WD_ALIGN_PARAGRAPH
         
-        doc = Document()
+        doc = Document(BytesIO(_docx_template_bytes()))
         
-        # Set default font
-        style = doc.styles['Normal']
-        font = style.font
-        font.name = 'Arial'
-        font.size = Pt(11)
+        # Resolve the styles once; passing style objects skips the by-name lookup per paragraph
+        normal_style = doc.styles['Normal']
+        title_style = doc.styles['Heading 1']
+        heading_style = doc.styles['Heading 2']
+        bullet_style = doc.styles['List Bullet']
         
         # Add header info
-        header = doc.add_paragraph()
+        header = doc.add_paragraph(style=normal_style)
         header.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = header.add_run(f"Generated Articles - {self._role.value.replace('_', ' ').title()}")
+        run = header.add_run(f"Generated Articles - {self._role_title}")
         run.bold = True
         run.font.size = Pt(10)
         run.font.color.rgb = RGBColor(128, 128, 128)
         
-        doc.add_paragraph()  # Spacing
-        
         # Add each article
         for i, article in enumerate(self._articles, 1):
             if i > 1:
@@ -647,53 +1232,35 @@ Main Sections:
                 doc.add_page_break()
             
             # Article title
-            title = doc.add_heading(article['title'], level=1)
+            title = doc.add_paragraph(article['title'], style=title_style)
             title.alignment = WD_ALIGN_PARAGRAPH.LEFT
             
             # Tags
-            tags_para = doc.add_paragraph()
+            tags_para = doc.add_paragraph(style=normal_style)
             tags_run = tags_para.add_run(f"#{article['tags'].replace(', ', ' #').replace(',', ' #')}")
             tags_run.italic = True
             tags_run.font.color.rgb = RGBColor(0, 119, 181)  # LinkedIn blue
             tags_run.font.size = Pt(10)
             
-            doc.add_paragraph()  # Spacing
-            
             # Introduction
-            intro = doc.add_paragraph(article['introduction'])
-            intro.style = 'Normal'
-            
-            doc.add_paragraph()  # Spacing
+            doc.add_paragraph(article['introduction'], style=normal_style)
             
             # Main sections
             for section in article.get('main_sections', []):
-                # Section heading
-                heading = doc.add_heading(section.get('heading', 'Section'), level=2)
-                
-                # Section content
-                content = doc.add_paragraph(section.get('content', ''))
-                content.style = 'Normal'
-                
-                doc.add_paragraph()  # Spacing between sections
-            
-            # Conclusion heading
-            conclusion_heading = doc.add_heading('Conclusion', level=2)
+                doc.add_paragraph(section.get('heading', 'Section'), style=heading_style)
+                doc.add_paragraph(section.get('content', ''), style=normal_style)
             
-            # Conclusion text
-            conclusion = doc.add_paragraph(article['conclusion'])
-            conclusion.style = 'Normal'
-            
-            doc.add_paragraph()  # Spacing
+            # Conclusion
+            doc.add_paragraph('Conclusion', style=heading_style)
+            doc.add_paragraph(article['conclusion'], style=normal_style)
             
             # Key Insights
-            insights_heading = doc.add_heading('Key Takeaways', level=2)
-            
+            doc.add_paragraph('Key Takeaways', style=heading_style)
             for insight in article.get('key_insights', []):
-                insight_para = doc.add_paragraph(insight, style='List Bullet')
+                doc.add_paragraph(insight, style=bullet_style)
             
             # Metadata footer (optional - can be removed before posting)
-            doc.add_paragraph()
-            footer = doc.add_paragraph()
+            footer = doc.add_paragraph(style=normal_style)
             footer_run = footer.add_run(
                 f"\n___\n"
                 f"Source: {article['metadata'].get('source', 'N/A')}\n"
@@ -704,9 +1271,10 @@ Main Sections:
             footer_run.font.color.rgb = RGBColor(128, 128, 128)
             footer_run.italic = True
         
-        # Save document
-        doc.save(str(output_path))
-        logging.info(f"DOCX file saved with {len(self._articles)} article(s) ready for LinkedIn")
+        # Serialize document
+        buffer = BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
     
     def assemble_decision_flow(self):
         """Assemble article-specific decision flow for the workflow graph.
@@ -753,17 +1321,12 @@ Main Sections:
         question = state["messages"][0].content
         context = state["messages"][-1].content
         
-        # Include article insights in the context
-        articles_summary = "\n".join([
-            f"- {a['title']}: {', '.join(a['key_insights'][:3])}"
-            for a in self._articles[:5]  # Top 5 articles
-        ])
-        
+        # Include article insights in the context (rendered once per set of articles, not per question)
         prompt = generate_qa_prompt(
             role_context=self._role_context,
             question=question,
             context=context,
-            article_summaries=articles_summary
+            article_summaries=self._rendered_output("qa_summary", self._render_qa_summary)
         )
         
         response = self._llm_model.invoke([{"role": "user", "content": prompt}])
@@ -775,7 +1338,7 @@ Main Sections:
             raise ValueError("No articles available. Call initialize() first.")
         
         print("\n" + "="*80)
-        print(f"ARTICLE GENERATOR - {self._role.value.upper().replace('_', ' ')}")
+        print(f"ARTICLE GENERATOR - {self._role_title.upper()}")
         print("="*80 + "\n")
         
         # Show digest
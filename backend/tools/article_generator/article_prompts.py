@@ -82,7 +82,7 @@ def get_role_context(role: ArticleRole, custom_role_description: str = None) ->
     Raises:
         ValueError: If role is CUSTOM but no custom_role_description provided
     """
-    if role == ArticleRole.CUSTOM:
+    if role is ArticleRole.CUSTOM:
         if not custom_role_description:
             raise ValueError("custom_role_description is required when using ArticleRole.CUSTOM")
         return custom_role_description
@@ -90,56 +90,58 @@ def get_role_context(role: ArticleRole, custom_role_description: str = None) ->
     return ROLE_DEFINITIONS.get(role, ROLE_DEFINITIONS[ArticleRole.JOURNALIST])
 
 
-def generate_article_prompt(
+_LENGTH_GUIDANCE = {
+    "short": "Write a concise article (500-800 words) that captures the key insights.",
+    "medium": "Write a comprehensive article (1000-1500 words) with detailed analysis.",
+    "long": "Write an in-depth article (2000-3000 words) with thorough exploration of all aspects."
+}
+
+_STYLE_GUIDANCE = {
+    "formal": "Use a formal, professional tone with precise language and structured arguments.",
+    "conversational": "Use a conversational, engaging tone that connects with readers personally.",
+    "technical": "Use technical precision with industry-specific terminology and detailed explanations.",
+    "persuasive": "Use persuasive language that builds compelling arguments and calls to action."
+}
+
+
+def article_prompt_parts(
     role_context: str,
-    document_content: str,
     article_style: Literal["formal", "conversational", "technical", "persuasive"] = "formal",
     target_audience: str = "general audience",
     article_length: Literal["short", "medium", "long"] = "medium",
     focus_areas: str = None
-) -> str:
+) -> tuple[str, str]:
     """
-    Generate the article creation prompt based on role and parameters.
+    Render the article creation prompt around its source document.
+    
+    Everything except the document depends only on the article configuration, so it can be rendered
+    once and reused for every document: the prompt is `prefix + document_content + suffix`.
     
     Args:
         role_context: Professional role context (from get_role_context)
-        document_content: Source document content to analyze
         article_style: Writing style for the article
         target_audience: Intended audience description
         article_length: Desired article length
         focus_areas: Optional specific areas to focus on
         
     Returns:
-        Formatted prompt string
+        (prefix, suffix) of the prompt
     """
-    
-    length_guidance = {
-        "short": "Write a concise article (500-800 words) that captures the key insights.",
-        "medium": "Write a comprehensive article (1000-1500 words) with detailed analysis.",
-        "long": "Write an in-depth article (2000-3000 words) with thorough exploration of all aspects."
-    }
-    
-    style_guidance = {
-        "formal": "Use a formal, professional tone with precise language and structured arguments.",
-        "conversational": "Use a conversational, engaging tone that connects with readers personally.",
-        "technical": "Use technical precision with industry-specific terminology and detailed explanations.",
-        "persuasive": "Use persuasive language that builds compelling arguments and calls to action."
-    }
-    
     focus_instruction = f"\n\nSpecific Focus Areas: {focus_areas}" if focus_areas else ""
     
-    return f"""{role_context}
+    prefix = f"""{role_context}
 
 Analyze the following document and create a professional article based on your expertise:
 
 === SOURCE DOCUMENT ===
-{document_content}
+"""
+    suffix = f"""
 ===================
 
 Article Requirements:
 - Target Audience: {target_audience}
-- Writing Style: {style_guidance.get(article_style, style_guidance["formal"])}
-- Length: {length_guidance.get(article_length, length_guidance["medium"])}{focus_instruction}
+- Writing Style: {_STYLE_GUIDANCE.get(article_style, _STYLE_GUIDANCE["formal"])}
+- Length: {_LENGTH_GUIDANCE.get(article_length, _LENGTH_GUIDANCE["medium"])}{focus_instruction}
 
 Create an article that:
 1. Provides a compelling title that captures the essence
@@ -158,6 +160,35 @@ Format your response as a structured article with:
 - key_insights: List of 3-5 main insights
 - tags: Relevant topic tags/keywords
 """
+    return prefix, suffix
+
+
+def generate_article_prompt(
+    role_context: str,
+    document_content: str,
+    article_style: Literal["formal", "conversational", "technical", "persuasive"] = "formal",
+    target_audience: str = "general audience",
+    article_length: Literal["short", "medium", "long"] = "medium",
+    focus_areas: str = None
+) -> str:
+    """
+    Generate the article creation prompt based on role and parameters.
+    
+    Args:
+        role_context: Professional role context (from get_role_context)
+        document_content: Source document content to analyze
+        article_style: Writing style for the article
+        target_audience: Intended audience description
+        article_length: Desired article length
+        focus_areas: Optional specific areas to focus on
+        
+    Returns:
+        Formatted prompt string
+    """
+    prefix, suffix = article_prompt_parts(
+        role_context, article_style, target_audience, article_length, focus_areas
+    )
+    return f"{prefix}{document_content}{suffix}"
 
 
 def generate_digest_prompt(
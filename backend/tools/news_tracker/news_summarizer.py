@@ -49,6 +49,7 @@ class NewsSummarizer(BaseWorkFlow):
         super().__init__(llm_model)
         self._summaries: List[Dict] = []
         self._summary_length: str = "medium"
+        self._structured_llm = None
     
     def initialize(self,
                    news_urls: Union[List[str], List[Path]],
@@ -120,8 +121,9 @@ class NewsSummarizer(BaseWorkFlow):
 
         try:
             # Use structured output to ensure consistent format
-            structured_llm = self._llm_model.with_structured_output(ArticleSummary)
-            response: ArticleSummary = structured_llm.invoke([{"role": "user", "content": prompt}])
+            if self._structured_llm is None:
+                self._structured_llm = self._llm_model.with_structured_output(ArticleSummary)
+            response: ArticleSummary = self._structured_llm.invoke([{"role": "user", "content": prompt}])
             
             return {
                 "title": article.metadata.get('title', 'Untitled'),
@@ -18,14 +18,14 @@ from langchain_core.messages import AnyMessage
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode, tools_condition
-from dotenv import load_dotenv
+from utils.env import load_env_once
 
 from models import llm_basic
-from doc_loader.doc_importer import DocumentImporter
+from doc_loader.doc_importer import ChunkingStrategy, DocumentImporter
 from utils.draw_graph import disp_state_graph
 from tools.rag.create_retriever import Retriever
 
-load_dotenv(override=True)
+load_env_once(override=True)
 
 
 class RAGState(TypedDict):
@@ -77,7 +77,8 @@ class BaseWorkFlow(ABC):
                        data_sources: Union[List[Union[str, Path]], None] = None,
                        chunk_size: int = 1000,
                        chunk_overlap: int = 200,
-                       use_cache: bool = True) -> List[Document]:
+                       use_cache: bool = True,
+                       chunking_strategy: ChunkingStrategy = "fixed") -> List[Document]:
         """Load and preprocess documents from data sources.
         
         Args:
@@ -85,6 +86,7 @@ class BaseWorkFlow(ABC):
             chunk_size: Size of document chunks for processing
             chunk_overlap: Overlap between chunks
             use_cache: Whether to cache loaded documents
+            chunking_strategy: "fixed" (size-based) or "recursive" (structure-aware: headings, paragraphs, sentences)
             
         Returns:
             List of loaded Document objects
@@ -101,7 +103,8 @@ class BaseWorkFlow(ABC):
             data_sources=data_sources,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
-            use_cache=use_cache
+            use_cache=use_cache,
+            chunking_strategy=chunking_strategy
         )
         
         self._doc_loader.load_docs()
@@ -120,7 +123,8 @@ class BaseWorkFlow(ABC):
                                    name: str = "Retriever",
                                    description: str = "Retrieves relevant documents based on the query",
                                    additional_tools: Optional[dict] = None,
-                                   multilingual: bool = False) -> None:
+                                   multilingual: bool = False,
+                                   child_chunk_size: Optional[int] = None) -> None:
         """Setup retriever tool and bind all tools to LLM.
         
         Args:
@@ -128,6 +132,8 @@ class BaseWorkFlow(ABC):
             description: Description of what the retriever does
             additional_tools: Optional dict of additional tools to bind (e.g., {'tool_name': [tool_list]})
             multilingual: If True, use multilingual embeddings for Chinese/English support
+            child_chunk_size: If set, index child chunks of this size and retrieve their parent
+                document chunks (small-to-big retrieval); otherwise the loaded chunks are indexed as-is
             
         Raises:
             ValueError: If documents not loaded or retriever creation fails
@@ -140,7 +146,8 @@ class BaseWorkFlow(ABC):
             documents=self._documents,
             name=name,
             description=description,
-            multilingual=multilingual
+            multilingual=multilingual,
+            child_chunk_size=child_chunk_size
         )
         
         retriever_tool = self._retriever.get_retriever_tool()
@@ -149,6 +156,8 @@ class BaseWorkFlow(ABC):
         
         # Initialize tools dict with retriever
         self._tools = {"retriever_tool": [retriever_tool]}
+        # A graph compiled for the previous retriever would keep querying it
+        self._workflow_graph = None
         
         # Add any additional tools provided
         if additional_tools:
@@ -158,6 +167,7 @@ class BaseWorkFlow(ABC):
         self._llm_with_tools = self._llm_model.bind_tools(
             [tool for tool_list in self._tools.values() for tool in tool_list]
         )
+        self._initialized = True
         
         logging.info(f"Retriever and tools setup complete. Total tools: {len(self._tools)}")
 
@@ -199,18 +209,23 @@ class BaseWorkFlow(ABC):
         """
         return self._documents
 
+    @property
+    def is_initialized(self) -> bool:
+        """True once documents are loaded and the retriever tools are bound to the LLM."""
+        return self._initialized
+
     def _get_retriever_tool(self):
         """Get the retriever tool for this workflow.
         
         Returns:
-            The retriever tool to be used in the graph
+            The retriever tool bound to the LLM in _setup_retriever_and_tools, to be used in the graph
             
         Raises:
             ValueError: If retriever not initialized
         """
         if not self._retriever:
             raise ValueError("Retriever is not initialized. Please call initialize() first with valid data sources.")
-        return self._retriever.get_retriever_tool()
+        return self._tools["retriever_tool"][0]
 
 
     def generate_query_or_respond(self, state: RAGState):
@@ -324,7 +339,7 @@ class BaseWorkFlow(ABC):
         disp_state_graph(self._get_compiled_graph(), mmd_file_name=f"{graph_name}.mmd")
     
     def _get_compiled_graph(self):
-        """Compile the decision flow into an executable graph."""
+        """Compile the decision flow into an executable graph, once per retriever setup."""
         self._workflow_graph = self._workflow_graph or self.assemble_decision_flow().compile()
         return self._workflow_graph
 
@@ -5,6 +5,7 @@ from langchain_core.documents import Document
 from langchain_core.tools import tool, Tool
 from langchain_core.vectorstores import InMemoryVectorStore
 from langchain_huggingface import HuggingFaceEmbeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 
 """
@@ -28,17 +29,30 @@ class Retriever:
     The best practice would be to use doc_loader to load documents from various sources. Then
     pass the loaded documents to this class to create a retriever tool. The method get_retriever_tool
     can be used to get the retriever tool for use in a RAG workflow. Note that this class uses an in-memory vector store.
+    
+    With child_chunk_size set, retrieval is small-to-big (parent document retrieval): each document is split
+    into small child chunks that are embedded and searched, and the (larger) documents the best-matching
+    children belong to are returned. Small chunks match queries precisely; the parents give the LLM context.
     """
+    
+    # Parent-document mode: child chunks searched per query, and parents returned at most
+    CHILD_SEARCH_K = 8
+    PARENT_K = 4
+    
     def __init__(
         self,
         documents: Optional[List[Document]] = [],
         name: str = "retriever",
         description: str = "Retrieves relevant documents from a knowledge base.",
         embedding: Optional[HuggingFaceEmbeddings] = None,
-        multilingual: bool = False
+        multilingual: bool = False,
+        child_chunk_size: Optional[int] = None,
+        child_chunk_overlap: int = 40
     ):
         self.name = name
         self.description = description
+        # Parent documents by index, when retrieving small-to-big
+        self._parents: Optional[List[Document]] = None
         
         try:
             # Initialize embeddings using HuggingFace (free, no API key required)
@@ -66,7 +80,12 @@ class Retriever:
             self._vectorstore = InMemoryVectorStore(embedding=embedding)
             
             # Add documents
-            if documents:
+            if documents and child_chunk_size:
+                self._parents = list(documents)
+                children = self._split_children(self._parents, child_chunk_size, child_chunk_overlap)
+                self._vectorstore.add_documents(children)
+                logging.info(f"Added {len(children)} child chunks of {len(documents)} documents to vector store")
+            elif documents:
                 self._vectorstore.add_documents(documents)
                 logging.info(f"Added {len(documents)} documents to vector store")
             else:
@@ -82,11 +101,38 @@ class Retriever:
                 logging.error("  2. Ensure you have internet connection for first-time model download")
             raise
     
+    @staticmethod
+    def _split_children(parents: List[Document], chunk_size: int, chunk_overlap: int) -> List[Document]:
+        """Split each parent into child chunks that carry the parent's index as parent_id."""
+        splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        return [
+            Document(page_content=text, metadata={**parent.metadata, "parent_id": parent_id})
+            for parent_id, parent in enumerate(parents)
+            for text in splitter.split_text(parent.page_content)
+        ]
+    
+    def _parents_of(self, children: List[Document], limit: int) -> List[Document]:
+        """Distinct parents of the ranked child chunks, best match first."""
+        parent_ids = dict.fromkeys(child.metadata["parent_id"] for child in children)
+        return [self._parents[parent_id] for parent_id in list(parent_ids)[:limit]]
+    
+    def search(self, query: str) -> List[Document]:
+        """Documents relevant to the query: the retriever's matches, or their parents in small-to-big mode."""
+        if self._parents is None:
+            return self._retriever.invoke(query)
+        
+        children = self._vectorstore.similarity_search(query, k=self.CHILD_SEARCH_K)
+        return self._parents_of(children, self.PARENT_K)
+    
     def retrieve_context(self, query: str, k: int = 5) -> List[Document]:
         """Retrieve information to help answer a query."""
 
         try:
-            retrieved_docs = self._vectorstore.similarity_search(query, k=k)
+            if self._parents is None:
+                retrieved_docs = self._vectorstore.similarity_search(query, k=k)
+            else:
+                children = self._vectorstore.similarity_search(query, k=2 * k)
+                retrieved_docs = self._parents_of(children, k)
 
             serialized = "\n\n".join(
                 (f"Source: {doc.metadata}\nContent: {doc.page_content}")
@@ -103,7 +149,7 @@ class Retriever:
         """Create and return a retriever tool for the knowledge base."""
         try:
             # Create a proper tool function that works with LangGraph
-            retriever = self._retriever
+            search = self.search
             tool_name = self.name
             tool_description = self.description
             
@@ -111,7 +157,7 @@ class Retriever:
             def retrieve_documents(query: Annotated[str, "The search query to find relevant documents"]) -> str:
                 """Retrieve relevant documents from the knowledge base."""
                 try:
-                    docs = retriever.invoke(query)
+                    docs = search(query)
                     if not docs:
                         return "No relevant documents found."
                     
@@ -2,9 +2,9 @@ import logging
 from pathlib import Path
 from typing import List, Union, Optional
 from langchain_anthropic import ChatAnthropic as AIChatClass
-from dotenv import load_dotenv
+from utils.env import load_env_once
 
-load_dotenv()
+load_env_once()
 
 from tools.rag.base_workflow import BaseWorkFlow
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from flask import request, jsonify, Blueprint, Response
 from langchain_core.messages import HumanMessage, AIMessage
 from typing import Annotated, List
@@ -39,6 +40,7 @@ def get_or_create_conversation(conversation_id: str = None) -> ChatState:
     conversation_store[new_conversation.conversation_id] = new_conversation
     return new_conversation
 
+@lru_cache(maxsize=1)
 def init_workflow():
     """Initialize the RAG workflow singleton."""
     from tools.rag.workflow import RAG_WORKFLOW_INSTANCE
@@ -1,3 +1,6 @@
+import json
+import msgpack
+import zstandard
 from langchain_core.messages import (
     AIMessage, 
     HumanMessage, 
@@ -95,3 +98,29 @@ def serialize_messages(messages: list[AnyMessage]) -> list[dict]:
             serialized.append(msg_dict)
         
         return serialized
+
+
+# Leading byte of a packed payload, so older encodings stay readable after a format change
+_PAYLOAD_JSON = 0
+_PAYLOAD_MSGPACK_ZSTD = 1
+
+
+def pack_payload(payload: dict | list) -> bytes:
+    """
+    Encode a serialized message payload as a compact binary blob (msgpack + zstd).
+    The first byte records the encoding version.
+    """
+    compressed = zstandard.ZstdCompressor(level=3).compress(msgpack.packb(payload))
+    return bytes([_PAYLOAD_MSGPACK_ZSTD]) + compressed
+
+
+def unpack_payload(blob: bytes) -> dict | list:
+    """Decode a blob produced by pack_payload (or a legacy JSON-encoded blob)."""
+    version, body = blob[0], blob[1:]
+
+    if version == _PAYLOAD_MSGPACK_ZSTD:
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(body))
+    if version == _PAYLOAD_JSON:
+        return json.loads(body.decode("utf-8"))
+
+    raise ValueError(f"Unknown payload encoding version: {version}")
@@ -0,0 +1,20 @@
+from dotenv import load_dotenv
+
+# Set once .env has been loaded, and once it has been loaded with override=True
+_loaded = False
+_overridden = False
+
+
+def load_env_once(override: bool = False):
+    """
+    Load the .env file into the environment, once per process.
+    A later call with override=True still re-applies it over existing variables, once.
+    """
+    global _loaded, _overridden
+
+    if _overridden or (_loaded and not override):
+        return
+
+    load_dotenv(override=override)
+    _loaded = True
+    _overridden = override
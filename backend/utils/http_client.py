@@ -1,3 +1,5 @@
+import atexit
+import importlib.util
 import logging
 import httpx
 import urllib3
@@ -6,8 +8,35 @@ from utils.ssl_verification import bypass_ssl_verification
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 bypass_ssl_verification()
 
-HTTP_CLIENT = httpx.Client(verify=False)
-ASYNC_HTTP_CLIENT = httpx.AsyncClient(verify=False)
+# One pooled, keep-alive client per process, shared by every model client, so TLS handshakes
+# are amortized across calls. HTTP/2 (h2, installed with httpx[http2]) multiplexes concurrent
+# requests to the same host over one connection; environments without h2 fall back to HTTP/1.1.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+HTTP_CLIENT = httpx.Client(
+    verify=False,
+    timeout=_TIMEOUT,
+    transport=httpx.HTTPTransport(verify=False, http2=_HTTP2_AVAILABLE, limits=_LIMITS, retries=2)
+)
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """
+    Async client with the shared pool settings. Pooled async connections belong to the event loop
+    that opened them, so code that runs its own short-lived loop (asyncio.run) should use one of
+    these rather than ASYNC_HTTP_CLIENT.
+    """
+    return httpx.AsyncClient(
+        verify=False,
+        timeout=_TIMEOUT,
+        transport=httpx.AsyncHTTPTransport(verify=False, http2=_HTTP2_AVAILABLE, limits=_LIMITS, retries=2)
+    )
+
+
+ASYNC_HTTP_CLIENT = create_async_http_client()
+atexit.register(HTTP_CLIENT.close)
 
 # NOTE: Run the following command if you face SSL certificate issues on Windows
 # pip install --upgrade certifi python-certifi-win32 to solve cert issues on Windows
@@ -0,0 +1,48 @@
+import logging
+from contextlib import contextmanager
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@contextmanager
+def count_queries(engine: Engine):
+    """
+    Record every SQL statement executed on the engine inside the block.
+    Useful to catch N+1 regressions on hot paths, e.g.:
+
+        with count_queries(SQLALCHEMY_DB.engine) as queries:
+            ChatStateRepository.load_chat_state(conversation_id=conversation_id)
+        assert len(queries) <= 2
+    """
+    queries = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def register_query_counter(app: Flask, engine: Engine, threshold: int):
+    """
+    Dev-mode hook: count the SQL statements issued while handling each request and log a
+    warning when a request exceeds the threshold. Streamed responses are counted until the
+    stream closes, since the request teardown only runs then.
+    """
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.sql_query_count = g.get("sql_query_count", 0) + 1
+
+    @app.teardown_request
+    def _warn_on_query_count(exc):
+        query_count = g.get("sql_query_count", 0)
+        if query_count > threshold:
+            logging.warning(f"{request.method} {request.path} issued {query_count} SQL queries (threshold {threshold})")
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    logging.info(f"SQL query counter enabled; warning above {threshold} queries per request")